@@ -4,20 +4,28 @@ from __future__ import annotations
 import json
 import logging
 import os
+import pickle
+import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Any, Callable, Optional, Tuple
 
-from dateutil import parser
+import orjson
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
-from cachetools import TTLCache
-from tenacity import retry, stop_after_attempt, wait_exponential
+from cachetools import TLRUCache, TTLCache
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 logger = logging.getLogger(__name__)
 
 from nba_api.live.nba.endpoints import scoreboard, boxscore
+from nba_api.live.nba.library.http import NBALiveHTTP
 from nba_api.stats.endpoints import (
     commonplayerinfo,
     commonteamroster,
@@ -29,84 +37,201 @@ from nba_api.stats.endpoints import (
     teaminfocommon,
     leagueleaders,
 )
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.library.parameters import PlayerOrTeamAbbreviation, Season, StatCategoryAbbreviation
 
 import config
 import constants
 
 
+@lru_cache(maxsize=1)
+def _shared_session() -> requests.Session:
+    """One pooled keep-alive Session for stats.nba.com and cdn.nba.com, installed on the nba_api HTTP classes."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://stats.nba.com", adapter)
+    session.mount("https://cdn.nba.com", adapter)
+    NBAStatsHTTP.set_session(session)
+    NBALiveHTTP.set_session(session)
+    return session
+
+
+@lru_cache(maxsize=1)
 def _disk_cache_dir() -> str:
+    """Cache directory under CONFIG_DIR; created on first use only."""
     d = os.path.join(config.CONFIG_DIR, "cache")
     os.makedirs(d, exist_ok=True)
     return d
 
 
+@lru_cache(maxsize=256)
+def _disk_cache_path(key: str, ext: str = ".json") -> str:
+    """File path for a cache key (":" replaced, since it is not valid in Windows file names)."""
+    return os.path.join(_disk_cache_dir(), key.replace(":", "_") + ext)
+
+
 def _disk_cache_get(key: str, ttl: int) -> Optional[Any]:
-    path = os.path.join(_disk_cache_dir(), f"{key}.json")
-    if not os.path.isfile(path):
-        return None
+    """Return cached data at most ttl seconds old, else None."""
+    path = _disk_cache_path(key)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        ts = data.get("ts", 0)
-        if time.time() - ts >= ttl:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        age = time.time() - data.get("ts", 0)
+        if not 0 <= age <= ttl:
             return None
         return data.get("data")
-    except (json.JSONDecodeError, OSError):
+    except (orjson.JSONDecodeError, OSError):
         return None
 
 
 def _disk_cache_set(key: str, value: Any) -> None:
-    path = os.path.join(_disk_cache_dir(), f"{key}.json")
+    path = _disk_cache_path(key)
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"ts": time.time(), "data": value}, f, indent=0)
-    except OSError:
+        config.atomic_write(path, orjson.dumps({"ts": time.time(), "data": value}, option=orjson.OPT_SERIALIZE_NUMPY))
+    except (orjson.JSONEncodeError, OSError):
         pass
 
 
-def _disk_cache_get_offline(key: str, max_age_seconds: int) -> Optional[Any]:
-    """Return cached data if file exists and age <= max_age_seconds (for offline fallback)."""
-    path = os.path.join(_disk_cache_dir(), f"{key}.json")
-    if not os.path.isfile(path):
-        return None
+def _disk_cache_get_frames(key: str, ttl: int) -> Optional[dict]:
+    """Return the dict of DataFrames stored by _disk_cache_set_frames if younger than ttl, else None."""
+    path = _disk_cache_path(key, ".pkl")
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        ts = data.get("ts", 0)
-        if time.time() - ts > max_age_seconds:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        age = time.time() - data.get("ts", 0)
+        if not 0 <= age < ttl:
             return None
         return data.get("data")
-    except (json.JSONDecodeError, OSError):
+    except Exception:
         return None
 
 
+def _disk_cache_set_frames(key: str, frames: dict) -> None:
+    """Pickle a dict of DataFrames (dtypes preserved, no records round-trip)."""
+    path = _disk_cache_path(key, ".pkl")
+    try:
+        config.atomic_write(path, pickle.dumps({"ts": time.time(), "data": frames}, protocol=pickle.HIGHEST_PROTOCOL))
+    except (pickle.PicklingError, OSError):
+        pass
+
+
+def _standings_from_frames(frames: Optional[dict]) -> Tuple[Optional[Any], Optional[Any]]:
+    """(east, west) from a cached frames dict; empty or missing conferences become None."""
+    if not frames:
+        return None, None
+    east, west = frames.get("east"), frames.get("west")
+    if east is not None and east.empty:
+        east = None
+    if west is not None and west.empty:
+        west = None
+    return east, west
+
+
+def _is_final(game: dict) -> bool:
+    """True if a scoreboard/box score game dict is finished (gameStatus 3)."""
+    return game.get("gameStatus") == 3 or str(game.get("gameStatusText", "")).startswith("Final")
+
+
+def _is_live(game: dict) -> bool:
+    """True if a scoreboard game dict is in progress (gameStatus 2)."""
+    return game.get("gameStatus") == 2
+
+
+def _games_ttu(key: str, value: Any, now: float) -> float:
+    """TLRUCache expiry for games:{date}: past all-final dates are kept long, dates with live games briefly."""
+    date_str = key.partition(":")[2]
+    games = value[0] if value else []
+    if date_str < datetime.now().date().isoformat() and all(_is_final(g) for g in games):
+        return now + constants.CACHE_TTL_FINAL
+    if any(_is_live(g) for g in games):
+        return now + constants.CACHE_TTL_GAMES_LIVE
+    return now + constants.CACHE_TTL_GAMES
+
+
+def _box_ttu(key: str, value: Any, now: float) -> float:
+    """TLRUCache expiry for box:{game_id}: final box scores are kept long, live ones briefly."""
+    if isinstance(value, dict) and _is_final(value):
+        return now + constants.CACHE_TTL_FINAL
+    return now + constants.CACHE_TTL_BOX_SCORE
+
+
+def _team_ttu(key: Any, value: Any, now: float) -> float:
+    """TLRUCache expiry for team info/roster: an hour for hits, briefly for failed (None) lookups."""
+    return now + (constants.CACHE_TTL_TEAM if value is not None else constants.CACHE_TTL_NEGATIVE)
+
+
+def _memo_value(memo: Optional[Tuple[Any, float]], ttl: int) -> Optional[Any]:
+    """Value of a single-slot (value, monotonic_ts) memo if younger than ttl, else None."""
+    if memo is None:
+        return None
+    value, ts = memo
+    return value if time.monotonic() - ts < ttl else None
+
+
+_ERR_RE = re.compile(r"(timeout|timed out)|(connection|network|unreachable)|(\brate|429|too many)|(404|not found)", re.I)
+_ERR_MESSAGES = (
+    None,
+    "Connection timeout. Try again later.",
+    "No connection. Check your network.",
+    "Too many requests. Wait a moment and retry.",
+    "Data not found.",
+)
+
+
 def _user_facing_error(exc: Exception, default_prefix: str) -> str:
     """Short, user-friendly message derived from the exception."""
     msg = str(exc).strip() or type(exc).__name__
-    err_lower = msg.lower()
-    if "timeout" in err_lower or "timed out" in err_lower:
-        return "Connection timeout. Try again later."
-    if "connection" in err_lower or "network" in err_lower or "unreachable" in err_lower:
-        return "No connection. Check your network."
-    if "rate" in err_lower or "429" in msg or "too many" in err_lower:
-        return "Too many requests. Wait a moment and retry."
-    if "404" in msg or "not found" in err_lower:
-        return "Data not found."
+    best = None
+    for m in _ERR_RE.finditer(msg):
+        if best is None or m.lastindex < best:
+            best = m.lastindex
+            if best == 1:
+                break
+    if best is not None:
+        return _ERR_MESSAGES[best]
     if len(msg) > 60:
         return default_prefix + ": " + msg[:57] + "..."
     return default_prefix + ": " + msg
 
 
-def _is_triple_double_row(row):
-    def _v(key):
-        try:
-            val = row.get(key, 0)
-            return int(float(val)) if val is not None and str(val) != "nan" else 0
-        except (TypeError, ValueError):
-            return 0
-    pts, reb, ast, stl, blk = _v("PTS"), _v("REB"), _v("AST"), _v("STL"), _v("BLK")
-    return sum(1 for x in (pts, reb, ast, stl, blk) if x >= 10) >= 3
+def _result_set(endpoint: Any, index: int = 0) -> Tuple[list, list]:
+    """(headers, rowSet) of a stats endpoint's raw JSON, without building a DataFrame."""
+    raw = endpoint.get_dict()
+    sets = raw.get("resultSets") or raw.get("resultSet")
+    rs = sets[index] if isinstance(sets, list) else sets
+    return rs["headers"], rs["rowSet"]
+
+
+GAME_LOG_COLS = ("GAME_DATE", "MATCHUP", "WL", "PTS")
+
+
+def _records(headers: list, rows: list, cols: Optional[tuple] = None) -> list:
+    """Rows as dicts; with cols, only those columns (missing ones skipped)."""
+    if cols is None:
+        return [dict(zip(headers, r)) for r in rows]
+    idx = [(c, headers.index(c)) for c in cols if c in headers]
+    return [{c: r[i] for c, i in idx} for r in rows]
+
+
+TRIPLE_DOUBLE_COLS = ["PTS", "REB", "AST", "STL", "BLK"]
+
+
+def _games_against(df: pd.DataFrame, opponent: str, cols: list) -> pd.DataFrame:
+    """Rows of a team game log whose MATCHUP ("LAL vs. BOS" / "LAL @ BOS") is against opponent, limited to cols."""
+    opp = df["MATCHUP"].astype(str).str.split(r" vs\. | @ ", n=1, regex=True).str[1].str.strip()
+    return df.loc[opp == opponent].reindex(columns=cols)
+
+
+def _triple_double_mask(df: pd.DataFrame):
+    """Boolean array: True for rows with 10+ in at least three of PTS/REB/AST/STL/BLK (missing or non-numeric = 0)."""
+    stats = (
+        df.reindex(columns=TRIPLE_DOUBLE_COLS)
+        .apply(pd.to_numeric, errors="coerce")
+        .fillna(0)
+        .to_numpy(dtype="float32")
+        .astype("int16")
+    )
+    return (stats >= 10).sum(axis=1, dtype="int8") >= 3
 
 
 def build_quarter_scores(away_team, home_team):
@@ -114,29 +239,26 @@ def build_quarter_scores(away_team, home_team):
     home_periods = home_team.get("periods") or []
     if not away_periods and not home_periods:
         return None
-    by_period = {}
-    for p in away_periods:
-        num = p.get("period") or 0
-        score = p.get("score") or 0
-        if num not in by_period:
-            by_period[num] = [0, 0]
-        by_period[num][0] = score
-    for p in home_periods:
-        num = p.get("period") or 0
-        score = p.get("score") or 0
-        if num not in by_period:
-            by_period[num] = [0, 0]
-        by_period[num][1] = score
+    by_period = defaultdict(lambda: [0, 0])
+    for side, periods in ((0, away_periods), (1, home_periods)):
+        for p in periods:
+            by_period[p.get("period") or 0][side] = p.get("score") or 0
     if not by_period:
         return None
-    reg = [1, 2, 3, 4]
-    ot_periods = sorted(k for k in by_period if k not in reg)
     headers = ["Q1", "Q2", "Q3", "Q4"]
-    away_scores = [by_period.get(i, [0, 0])[0] for i in reg]
-    home_scores = [by_period.get(i, [0, 0])[1] for i in reg]
-    if ot_periods:
-        away_ot = sum(by_period.get(k, [0, 0])[0] for k in ot_periods)
-        home_ot = sum(by_period.get(k, [0, 0])[1] for k in ot_periods)
+    away_scores = [0, 0, 0, 0]
+    home_scores = [0, 0, 0, 0]
+    away_ot = home_ot = 0
+    has_ot = False
+    for num, (away, home) in by_period.items():
+        if num in (1, 2, 3, 4):
+            away_scores[num - 1] = away
+            home_scores[num - 1] = home
+        else:
+            has_ot = True
+            away_ot += away
+            home_ot += home
+    if has_ot:
         headers.append("OT")
         away_scores.append(away_ot)
         home_scores.append(home_ot)
@@ -152,9 +274,20 @@ def build_quarter_scores(away_team, home_team):
     return {"headers": headers, "away": away_scores, "home": home_scores}
 
 
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """True for errors worth retrying: timeouts, dropped connections, 429/5xx, and the empty or HTML bodies stats.nba.com returns when throttling."""
+    if isinstance(exc, requests.HTTPError):
+        return exc.response is not None and exc.response.status_code in _RETRYABLE_STATUS
+    return isinstance(exc, (requests.Timeout, requests.ConnectionError, json.JSONDecodeError))
+
+
 @retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=1, max=10),
+    stop=stop_after_attempt(constants.RETRY_MAX_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=constants.RETRY_BASE_DELAY, max=10, jitter=2),
+    retry=retry_if_exception(_is_transient),
     reraise=True,
 )
 def _with_retry(thunk: Callable[[], Any]) -> Any:
@@ -164,12 +297,23 @@ def _with_retry(thunk: Callable[[], Any]) -> Any:
 
 class ApiClient:
     def __init__(self):
-        self._cache_games = TTLCache(maxsize=128, ttl=constants.CACHE_TTL_GAMES)
-        self._cache_standings = TTLCache(maxsize=4, ttl=constants.CACHE_TTL_STANDINGS)
-        self._cache_leaders = TTLCache(maxsize=4, ttl=constants.CACHE_TTL_LEAGUE_LEADERS)
-        self._cache_box = TTLCache(maxsize=64, ttl=constants.CACHE_TTL_BOX_SCORE)
+        self._session = _shared_session()
+        self._cache_games = TLRUCache(maxsize=128, ttu=_games_ttu)
+        self._games_lock = threading.Lock()
+        self._memo_standings: Optional[Tuple[Any, float]] = None
+        self._memo_leaders: Optional[Tuple[Any, float]] = None
+        self._cache_box = TLRUCache(maxsize=64, ttu=_box_ttu)
+        self._cache_leader_rows = TTLCache(maxsize=8, ttl=constants.CACHE_TTL_LEAGUE_LEADERS)
+        self._leader_rows_lock = threading.Lock()
+        self._cache_team_info = TLRUCache(maxsize=64, ttu=_team_ttu)
+        self._cache_team_roster = TLRUCache(maxsize=64, ttu=_team_ttu)
         self._last_error = None
         self._last_request_time: float = 0
+        self._rate_lock = threading.Lock()
+        self._request_slots = threading.BoundedSemaphore(constants.MAX_CONCURRENT_REQUESTS)
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
+        self._today_cached: Tuple[float, str] = (float("-inf"), "")
         self._last_games_from_cache = False
         self._last_standings_from_cache = False
         self._last_leaders_from_cache = False
@@ -183,13 +327,40 @@ class ApiClient:
         )
 
     def _rate_limit(self) -> None:
-        """Wait for minimum interval between requests (rate limiting)."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < constants.RATE_LIMIT_MIN_INTERVAL:
-            delay = constants.RATE_LIMIT_MIN_INTERVAL - elapsed
+        """Wait for minimum interval between requests (rate limiting). Thread-safe: each caller reserves its own slot."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start = max(now, self._last_request_time + constants.RATE_LIMIT_MIN_INTERVAL)
+            self._last_request_time = start
+        delay = start - now
+        if delay > 0:
             logger.debug("Rate limit: waiting %.2fs", delay)
             time.sleep(delay)
-        self._last_request_time = time.time()
+
+    def _throttled(self, thunk: Callable[[], Any]) -> Any:
+        """Run thunk with retry, capped at MAX_CONCURRENT_REQUESTS in flight and spaced by the rate limit."""
+        with self._request_slots:
+            self._rate_limit()
+            return _with_retry(thunk)
+
+    def _singleflight(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn once per key at a time; concurrent callers with the same key wait for and share its result."""
+        with self._inflight_lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = Future()
+                self._inflight[key] = fut
+        if not leader:
+            return fut.result()
+        try:
+            fut.set_result(fn())
+        except BaseException as e:
+            fut.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return fut.result()
 
     def get_last_error(self) -> Optional[str]:
         return self._last_error
@@ -203,143 +374,139 @@ class ApiClient:
         """
         cache_key = f"games:{game_date_iso}"
         games, scoreboard_date = [], game_date_iso
-        offline_games = _disk_cache_get_offline(cache_key, constants.CACHE_TTL_OFFLINE)
+        offline_games = _disk_cache_get(cache_key, constants.CACHE_TTL_OFFLINE)
         if offline_games is not None and isinstance(offline_games, (list, tuple)) and len(offline_games) >= 2:
             games, scoreboard_date = offline_games[0], offline_games[1]
 
-        east, west = None, None
-        disk_standings = _disk_cache_get_offline("standings", constants.CACHE_TTL_OFFLINE)
-        if disk_standings is not None:
-            try:
-                east = pd.DataFrame(disk_standings["east"]) if disk_standings.get("east") else None
-                west = pd.DataFrame(disk_standings["west"]) if disk_standings.get("west") else None
-                if east is not None and east.empty:
-                    east = None
-                if west is not None and west.empty:
-                    west = None
-            except Exception:
-                pass
+        east, west = _standings_from_frames(_disk_cache_get_frames("standings", constants.CACHE_TTL_OFFLINE))
 
         league_leaders = {"PTS": [], "REB": [], "AST": [], "TDBL": []}
-        disk_leaders = _disk_cache_get_offline("league_leaders", constants.CACHE_TTL_OFFLINE)
+        disk_leaders = _disk_cache_get("league_leaders", constants.CACHE_TTL_OFFLINE)
         if disk_leaders is not None and isinstance(disk_leaders, dict):
-            for k, v in disk_leaders.items():
-                league_leaders[k] = [tuple(x) for x in v] if isinstance(v, list) else v
+            league_leaders.update(disk_leaders)
 
         return (games, scoreboard_date, east, west, league_leaders)
 
-    def _cache_get(self, cache: Any, key: str) -> Any:
-        try:
-            return cache[key]
-        except KeyError:
-            return None
-
-    def _cache_set(self, cache: Any, key: str, value: Any) -> None:
-        cache[key] = value
+    def _today_iso(self) -> str:
+        """Today's date as YYYY-MM-DD, recomputed at most once a minute."""
+        checked_at, today = self._today_cached
+        now = time.monotonic()
+        if now - checked_at > 60:
+            today = datetime.now().date().isoformat()
+            self._today_cached = (now, today)
+        return today
+
+    def _cached_games(self, cache_key: str) -> Optional[Tuple[list, str]]:
+        """Memory-cached (games, scoreboard_date) for a games:{date} key, or None."""
+        with self._games_lock:
+            return self._cache_games.get(cache_key)
+
+    def _store_games(self, cache_key: str, result: Tuple[list, str]) -> None:
+        """Cache a games:{date} result in memory and on disk."""
+        with self._games_lock:
+            self._cache_games[cache_key] = result
+        _disk_cache_set(cache_key, result)
+
+    def _load_games(self, date_str: str, live_first: bool) -> Tuple[list, str]:
+        """Fetch the scoreboard for date_str (live ScoreBoard first when live_first), bypassing caches."""
+        if live_first:
+            try:
+                board = scoreboard.ScoreBoard(timeout=constants.REQUEST_TIMEOUT)
+                return board.games.get_dict(), board.score_board_date
+            except Exception:
+                pass
+        sb = scoreboardv3.ScoreboardV3(game_date=date_str, timeout=constants.REQUEST_TIMEOUT)
+        resp = sb.nba_response.get_dict()
+        scoreboard_data = resp.get("scoreboard", {})
+        games = scoreboard_data.get("games", [])
+        scoreboard_date = scoreboard_data.get("gameDate", date_str)
+        return games, scoreboard_date
 
     def fetch_games(self, game_date: Optional[str] = None) -> Tuple[list, str]:
-        today = datetime.now().date().isoformat()
-        date_str = game_date if game_date else today
+        date_str = game_date or self._today_iso()
         cache_key = f"games:{date_str}"
-        cached = self._cache_get(self._cache_games, cache_key)
+        cached = self._cached_games(cache_key)
         if cached is not None:
             return cached
-
-        def _do():
-            if game_date is None or date_str == today:
-                try:
-                    board = scoreboard.ScoreBoard(timeout=constants.REQUEST_TIMEOUT)
-                    return board.games.get_dict(), board.score_board_date
-                except Exception:
-                    pass
-            sb = scoreboardv3.ScoreboardV3(game_date=date_str, timeout=constants.REQUEST_TIMEOUT)
-            resp = sb.nba_response.get_dict()
-            scoreboard_data = resp.get("scoreboard", {})
-            games = scoreboard_data.get("games", [])
-            scoreboard_date = scoreboard_data.get("gameDate", date_str)
-            return games, scoreboard_date
+        live_first = game_date is None or date_str == self._today_iso()
 
         try:
             self._last_error = None
             self._last_games_from_cache = False
-            self._rate_limit()
-            result = _with_retry(_do)
-            self._cache_set(self._cache_games, cache_key, result)
-            _disk_cache_set(cache_key, result)
+            result = self._singleflight(cache_key, lambda: self._throttled(lambda: self._load_games(date_str, live_first)))
+            self._store_games(cache_key, result)
             return result
         except Exception as e:
             self._last_error = _user_facing_error(e, "Games")
             logger.warning("fetch_games failed: %s", e, exc_info=True)
-            offline = _disk_cache_get_offline(cache_key, constants.CACHE_TTL_OFFLINE)
+            offline = _disk_cache_get(cache_key, constants.CACHE_TTL_OFFLINE)
             if offline is not None and isinstance(offline, (list, tuple)) and len(offline) >= 2:
                 self._last_games_from_cache = True
                 return offline[0], offline[1]
             return [], date_str
 
+    def prefetch_games(self, game_date: str) -> None:
+        """Warm the games cache for game_date (e.g. adjacent days) without touching the UI error/offline flags."""
+        cache_key = f"games:{game_date}"
+        if self._cached_games(cache_key) is not None:
+            return
+        live_first = game_date == self._today_iso()
+        try:
+            result = self._singleflight(cache_key, lambda: self._throttled(lambda: self._load_games(game_date, live_first)))
+        except Exception as e:
+            logger.debug("prefetch_games %s failed: %s", game_date, e)
+            return
+        self._store_games(cache_key, result)
+
     def fetch_standings(self) -> Tuple[Optional[Any], Optional[Any]]:
-        disk = _disk_cache_get("standings", constants.CACHE_TTL_STANDINGS)
-        if disk is not None:
-            try:
-                east = pd.DataFrame(disk["east"]) if disk.get("east") else None
-                west = pd.DataFrame(disk["west"]) if disk.get("west") else None
-                if east is not None and east.empty:
-                    east = None
-                if west is not None and west.empty:
-                    west = None
-                return east, west
-            except Exception:
-                pass
-        cached = self._cache_get(self._cache_standings, "standings")
+        cached = _memo_value(self._memo_standings, constants.CACHE_TTL_STANDINGS)
         if cached is not None:
             return cached
+        disk = _disk_cache_get_frames("standings", constants.CACHE_TTL_STANDINGS)
+        if disk is not None:
+            result = _standings_from_frames(disk)
+            self._memo_standings = (result, time.monotonic())
+            return result
 
         def _do():
             standings = leaguestandingsv3.LeagueStandingsV3(timeout=constants.REQUEST_TIMEOUT)
             df = standings.get_data_frames()[0]
             if df.empty:
                 return None, None
-            east = df[df["Conference"] == "East"].sort_values("PlayoffRank")
-            west = df[df["Conference"] == "West"].sort_values("PlayoffRank")
-            return east, west
+            df = df.sort_values("PlayoffRank", kind="stable")
+            conf = df["Conference"].to_numpy()
+            return df[conf == "East"], df[conf == "West"]
 
         try:
             self._last_error = None
             self._last_standings_from_cache = False
-            self._rate_limit()
-            result = _with_retry(_do)
-            self._cache_set(self._cache_standings, "standings", result)
+            result = self._singleflight("standings", lambda: self._throttled(_do))
+            self._memo_standings = (result, time.monotonic())
             east, west = result
-            _disk_cache_set("standings", {
-                "east": east.to_dict(orient="records") if east is not None and not east.empty else [],
-                "west": west.to_dict(orient="records") if west is not None and not west.empty else [],
-            })
+            _disk_cache_set_frames("standings", {"east": east, "west": west})
             return result
         except Exception as e:
             self._last_error = _user_facing_error(e, "Standings")
             logger.warning("fetch_standings failed: %s", e, exc_info=True)
-            disk = _disk_cache_get_offline("standings", constants.CACHE_TTL_OFFLINE)
-            if disk is not None:
-                try:
-                    east = pd.DataFrame(disk["east"]) if disk.get("east") else None
-                    west = pd.DataFrame(disk["west"]) if disk.get("west") else None
-                    if east is not None and east.empty:
-                        east = None
-                    if west is not None and west.empty:
-                        west = None
-                    if east is not None or west is not None:
-                        self._last_standings_from_cache = True
-                        return east, west
-                except Exception:
-                    pass
+            east, west = _standings_from_frames(_disk_cache_get_frames("standings", constants.CACHE_TTL_OFFLINE))
+            if east is not None or west is not None:
+                self._last_standings_from_cache = True
+                return east, west
             return None, None
 
     def _fetch_triple_double_leaders(self):
+        """Top 3 season triple-double counts; the full game-log scan runs at most once per day (disk key tdbl, dated)."""
+        today = self._today_iso()
+        cached = _disk_cache_get("tdbl", constants.CACHE_TTL_TRIPLE_DOUBLES)
+        if isinstance(cached, dict) and cached.get("date") == today:
+            return cached.get("leaders", [])
         try:
-            log = leaguegamelog.LeagueGameLog(
-                player_or_team_abbreviation=PlayerOrTeamAbbreviation.player,
-                timeout=constants.REQUEST_TIMEOUT,
+            df = self._throttled(
+                lambda: leaguegamelog.LeagueGameLog(
+                    player_or_team_abbreviation=PlayerOrTeamAbbreviation.player,
+                    timeout=constants.REQUEST_TIMEOUT,
+                ).get_data_frames()[0]
             )
-            df = _with_retry(lambda: log.get_data_frames()[0])
             if df.empty:
                 return []
             name_col = next((c for c in ("PLAYER_NAME", "PLAYER", "NAME") if c in df.columns), None)
@@ -351,100 +518,99 @@ class ApiClient:
             group_cols = [name_col]
             if team_col:
                 group_cols.append(team_col)
-            df["_td"] = df.apply(_is_triple_double_row, axis=1)
-            td = df[df["_td"]].groupby(group_cols, dropna=False).size().reset_index(name="COUNT")
-            td = td.sort_values("COUNT", ascending=False).head(3)
-            return [
-                (str(row[name_col]), str(row[team_col]) if team_col else "-", int(row["COUNT"]))
-                for _, row in td.iterrows()
-            ]
+            td = df.loc[_triple_double_mask(df)].groupby(group_cols, sort=False, dropna=False).size().nlargest(3)
+            out = []
+            for key, count in td.items():
+                name, team = key if team_col else (key, "-")
+                out.append((str(name), str(team), int(count)))
         except Exception:
             return []
+        if out:
+            _disk_cache_set("tdbl", {"date": today, "leaders": out})
+        return out
+
+    def _get_leader_rows(self, stat) -> Tuple[list, list]:
+        """(headers, rows) of LeagueLeaders for one stat category, cached and shared by league and team pages."""
+        with self._leader_rows_lock:
+            cached = self._cache_leader_rows.get(stat)
+        if cached is not None:
+            return cached
+
+        def _do():
+            return _result_set(leagueleaders.LeagueLeaders(stat_category_abbreviation=stat, timeout=constants.REQUEST_TIMEOUT))
+
+        result = self._singleflight(f"leaders:{stat}", lambda: self._throttled(_do))
+        with self._leader_rows_lock:
+            self._cache_leader_rows[stat] = result
+        return result
 
     def fetch_league_leaders(self):
-        disk = _disk_cache_get("league_leaders", constants.CACHE_TTL_LEAGUE_LEADERS)
-        if disk is not None:
-            try:
-                out = {}
-                for k, v in disk.items():
-                    out[k] = [tuple(x) for x in v] if isinstance(v, list) else v
-                return out
-            except Exception:
-                pass
-        cached = self._cache_get(self._cache_leaders, "league_leaders")
+        cached = _memo_value(self._memo_leaders, constants.CACHE_TTL_LEAGUE_LEADERS)
         if cached is not None:
             return cached
+        disk = _disk_cache_get("league_leaders", constants.CACHE_TTL_LEAGUE_LEADERS)
+        if isinstance(disk, dict):
+            self._memo_leaders = (disk, time.monotonic())
+            return disk
 
         try:
             self._last_leaders_from_cache = False
-            self._rate_limit()
             result = {"PTS": [], "REB": [], "AST": [], "TDBL": []}
 
-            def _fetch_pts():
-                ldf = leagueleaders.LeagueLeaders(stat_category_abbreviation=StatCategoryAbbreviation.pts, timeout=constants.REQUEST_TIMEOUT).get_data_frames()[0]
-                return "PTS", [(p.get("PLAYER", "-"), p.get("TEAM", "-"), p.get("PTS", 0)) for _, p in ldf.head(3).iterrows()]
-            def _fetch_reb():
-                ldf = leagueleaders.LeagueLeaders(stat_category_abbreviation=StatCategoryAbbreviation.reb, timeout=constants.REQUEST_TIMEOUT).get_data_frames()[0]
-                return "REB", [(p.get("PLAYER", "-"), p.get("TEAM", "-"), p.get("REB", 0)) for _, p in ldf.head(3).iterrows()]
-            def _fetch_ast():
-                ldf = leagueleaders.LeagueLeaders(stat_category_abbreviation=StatCategoryAbbreviation.ast, timeout=constants.REQUEST_TIMEOUT).get_data_frames()[0]
-                return "AST", [(p.get("PLAYER", "-"), p.get("TEAM", "-"), p.get("AST", 0)) for _, p in ldf.head(3).iterrows()]
+            def _fetch_leaders(stat, col):
+                headers, rows = self._get_leader_rows(stat)
+                top = (dict(zip(headers, r)) for r in rows[:3])
+                return [(p.get("PLAYER", "-"), p.get("TEAM", "-"), p.get(col, 0)) for p in top]
 
+            stats = (
+                (StatCategoryAbbreviation.pts, "PTS"),
+                (StatCategoryAbbreviation.reb, "REB"),
+                (StatCategoryAbbreviation.ast, "AST"),
+            )
             with ThreadPoolExecutor(max_workers=4) as executor:
-                futures = [
-                    executor.submit(_with_retry, _fetch_pts),
-                    executor.submit(_with_retry, _fetch_reb),
-                    executor.submit(_with_retry, _fetch_ast),
-                    executor.submit(_with_retry, self._fetch_triple_double_leaders),
-                ]
+                futures = {executor.submit(_fetch_leaders, stat, col): col for stat, col in stats}
+                futures[executor.submit(self._fetch_triple_double_leaders)] = "TDBL"
                 for fut in as_completed(futures):
                     try:
-                        data = fut.result()
-                        if isinstance(data, tuple) and len(data) == 2:
-                            result[data[0]] = data[1]
-                        elif isinstance(data, list):
-                            result["TDBL"] = data
+                        result[futures[fut]] = fut.result()
                     except Exception:
                         pass
 
-            self._cache_set(self._cache_leaders, "league_leaders", result)
-            _disk_cache_set("league_leaders", {k: [list(t) for t in v] for k, v in result.items()})
+            self._memo_leaders = (result, time.monotonic())
+            _disk_cache_set("league_leaders", result)
             return result
         except Exception as e:
             logger.warning("fetch_league_leaders failed: %s", e)
-            offline = _disk_cache_get_offline("league_leaders", constants.CACHE_TTL_OFFLINE)
+            offline = _disk_cache_get("league_leaders", constants.CACHE_TTL_OFFLINE)
             if offline is not None and isinstance(offline, dict):
                 self._last_leaders_from_cache = True
-                out = {}
-                for k, v in offline.items():
-                    out[k] = [tuple(x) for x in v] if isinstance(v, list) else v
-                return out
+                return offline
             return {"PTS": [], "REB": [], "AST": [], "TDBL": []}
 
     def get_box_score(self, game_id: Optional[str]) -> Optional[dict]:
         if not game_id:
             return None
         cache_key = f"box:{game_id}"
-        cached = self._cache_get(self._cache_box, cache_key)
-        if cached is not None:
-            return cached
         try:
-            bs = boxscore.BoxScore(game_id, timeout=constants.REQUEST_TIMEOUT)
-            game_data = bs.game.get_dict()
-            self._cache_set(self._cache_box, cache_key, game_data)
+            return self._cache_box[cache_key]
+        except KeyError:
+            pass
+        try:
+            game_data = self._singleflight(
+                cache_key, lambda: boxscore.BoxScore(game_id, timeout=constants.REQUEST_TIMEOUT).game.get_dict()
+            )
+            self._cache_box[cache_key] = game_data
             return game_data
         except Exception:
             return None
 
-    def fetch_team_games(self, team_id: int, limit: int = 10) -> list:
-        """Last/recent games for a team (by team_id). Returns list of dicts with GAME_DATE, MATCHUP, WL, PTS, etc."""
+    def fetch_team_games(self, team_id: int, limit: int = 10, cols: Optional[tuple] = GAME_LOG_COLS) -> list:
+        """Last/recent games for a team (by team_id). Returns list of dicts with GAME_DATE, MATCHUP, WL, PTS (cols=None for all columns)."""
         try:
             self._rate_limit()
             log = teamgamelog.TeamGameLog(team_id=team_id, season=Season.default, timeout=constants.REQUEST_TIMEOUT)
-            df = log.get_data_frames()[0]
-            if df.empty:
-                return []
-            return df.head(limit).to_dict("records")
+            headers, rows = _result_set(log)
+            return _records(headers, rows[:limit], cols)
         except Exception:
             return []
 
@@ -454,14 +620,25 @@ class ApiClient:
         today = datetime.now().date()
         tricode_upper = (team_tricode or "").strip().upper()
 
+        def day_games(date_str: str, disk_ttl: int) -> list:
+            cache_key = f"games:{date_str}"
+            cached = self._cached_games(cache_key)
+            if cached is not None:
+                return cached[0]
+            disk = _disk_cache_get(cache_key, disk_ttl)
+            if isinstance(disk, list) and len(disk) >= 2:
+                return disk[0]
+            sb = self._throttled(lambda: scoreboardv3.ScoreboardV3(game_date=date_str, timeout=constants.REQUEST_TIMEOUT))
+            scoreboard_data = sb.nba_response.get_dict().get("scoreboard", {})
+            result = (scoreboard_data.get("games", []), scoreboard_data.get("gameDate", date_str))
+            self._store_games(cache_key, result)
+            return result[0]
+
         def fetch_day(d: int):
             date_str = (today + timedelta(days=d)).isoformat()
             try:
-                self._rate_limit()
-                sb = scoreboardv3.ScoreboardV3(game_date=date_str, timeout=constants.REQUEST_TIMEOUT)
-                resp = sb.nba_response.get_dict()
                 out = []
-                for g in resp.get("scoreboard", {}).get("games", []):
+                for g in day_games(date_str, constants.CACHE_TTL_SCHEDULE if d > 0 else constants.CACHE_TTL_GAMES):
                     away = g.get("awayTeam", {}).get("teamTricode", "")
                     home = g.get("homeTeam", {}).get("teamTricode", "")
                     if tricode_upper in (away, home):
@@ -470,7 +647,7 @@ class ApiClient:
             except Exception:
                 return []
 
-        with ThreadPoolExecutor(max_workers=min(4, days + 1)) as executor:
+        with ThreadPoolExecutor(max_workers=min(8, days + 1)) as executor:
             futures = [executor.submit(fetch_day, d) for d in range(0, days + 1)]
             for fut in as_completed(futures):
                 games.extend(fut.result())
@@ -478,29 +655,52 @@ class ApiClient:
 
     def fetch_team_page_info(self, team_id):
         try:
-            return teaminfocommon.TeamInfoCommon(team_id=team_id, timeout=constants.REQUEST_TIMEOUT)
+            return self._cache_team_info[team_id]
+        except KeyError:
+            pass
+        try:
+            info = teaminfocommon.TeamInfoCommon(team_id=team_id, timeout=constants.REQUEST_TIMEOUT)
         except Exception:
-            return None
+            info = None
+        self._cache_team_info[team_id] = info
+        return info
 
     def fetch_team_page_leader(self, stat, tricode, col):
         try:
-            ldf = leagueleaders.LeagueLeaders(stat_category_abbreviation=stat, timeout=constants.REQUEST_TIMEOUT).get_data_frames()[0]
-            team_leaders = ldf[ldf["TEAM"] == tricode].head(3)
-            if not team_leaders.empty:
-                return (col, [(p.get("PLAYER", "-"), p.get(col, 0)) for _, p in team_leaders.iterrows()])
+            headers, rows = self._get_leader_rows(stat)
+            team_i = headers.index("TEAM")
+            player_i = headers.index("PLAYER") if "PLAYER" in headers else None
+            col_i = headers.index(col) if col in headers else None
+            out = []
+            for r in rows:
+                if r[team_i] == tricode:
+                    out.append((r[player_i] if player_i is not None else "-", r[col_i] if col_i is not None else 0))
+                    if len(out) == 3:
+                        break
+            return (col, out)
         except Exception:
             pass
         return (col, [])
 
-    def fetch_team_roster(self, team_id):
+    def _get_roster_rows(self, team_id) -> Optional[Tuple[list, list]]:
+        """(headers, rows) of CommonTeamRoster for a team, or None on failure; cached including failures."""
         try:
-            roster = commonteamroster.CommonTeamRoster(team_id=team_id, timeout=constants.REQUEST_TIMEOUT)
-            dfs = roster.get_data_frames()
-            if dfs and not dfs[0].empty:
-                return dfs[0]
-        except Exception:
+            return self._cache_team_roster[team_id]
+        except KeyError:
             pass
-        return None
+        try:
+            result = _result_set(commonteamroster.CommonTeamRoster(team_id=team_id, timeout=constants.REQUEST_TIMEOUT))
+        except Exception:
+            result = None
+        self._cache_team_roster[team_id] = result
+        return result
+
+    def fetch_team_roster_records(self, team_id, cols=("PLAYER", "NUM", "POSITION", "PLAYER_ID")) -> list:
+        """Roster rows as dicts restricted to cols, read straight from the raw result set (no DataFrame)."""
+        result = self._get_roster_rows(team_id)
+        if result is None:
+            return []
+        return _records(*result, cols)
 
     def fetch_player_info(self, player_id: int):
         """Fetch player profile and headline stats (CommonPlayerInfo). Returns dict with DISPLAY_FIRST_LAST, PTS, REB, AST, etc. or None."""
@@ -519,8 +719,8 @@ class ApiClient:
         except Exception:
             return None
 
-    def fetch_player_game_log(self, player_id: int, limit: int = 10) -> list:
-        """Fetch recent game log for a player. Returns list of dicts with GAME_DATE, MATCHUP, PTS, etc."""
+    def fetch_player_game_log(self, player_id: int, limit: int = 10, cols: Optional[tuple] = GAME_LOG_COLS) -> list:
+        """Fetch recent game log for a player. Returns list of dicts with GAME_DATE, MATCHUP, WL, PTS (cols=None for all columns)."""
         try:
             self._rate_limit()
             log = _with_retry(
@@ -530,10 +730,8 @@ class ApiClient:
                     timeout=constants.REQUEST_TIMEOUT,
                 )
             )
-            df = log.get_data_frames()[0]
-            if df.empty:
-                return []
-            return df.head(limit).to_dict("records")
+            headers, rows = _result_set(log)
+            return _records(headers, rows[:limit], cols)
         except Exception:
             return []
 
@@ -543,42 +741,23 @@ class ApiClient:
         Returns dict with last_meeting (date, matchup, pts_a, pts_b, wl_a) and season_series (wins_a, wins_b, games).
         """
         out = {"last_meeting": None, "season_series": {"wins_a": 0, "wins_b": 0, "games": []}}
-        tricode_b = next((t for t, tid in constants.TRICODE_TO_TEAM_ID.items() if tid == team_id_b), None)
-        tricode_a = next((t for t, tid in constants.TRICODE_TO_TEAM_ID.items() if tid == team_id_a), None)
+        tricode_b = constants.TEAM_ID_TO_TRICODE.get(team_id_b)
+        tricode_a = constants.TEAM_ID_TO_TRICODE.get(team_id_a)
         if not tricode_b or not tricode_a:
             return out
         try:
             self._rate_limit()
             log_a = teamgamelog.TeamGameLog(team_id=team_id_a, season=Season.default, timeout=constants.REQUEST_TIMEOUT)
             df_a = _with_retry(lambda: log_a.get_data_frames()[0])
-            games_a = []
-            for _, row in df_a.iterrows():
-                matchup = str(row.get("MATCHUP", ""))
-                opp = (matchup.split(" vs. ")[1].strip() if " vs. " in matchup else
-                       matchup.split(" @ ")[1].strip() if " @ " in matchup else "")
-                if opp == tricode_b:
-                    games_a.append({
-                        "GAME_DATE": row.get("GAME_DATE"),
-                        "MATCHUP": row.get("MATCHUP"),
-                        "WL": row.get("WL"),
-                        "PTS": row.get("PTS"),
-                    })
-            if not games_a:
+            sub_a = _games_against(df_a, tricode_b, ["GAME_DATE", "MATCHUP", "WL", "PTS"])
+            if sub_a.empty:
                 return out
-            games_a.sort(key=lambda g: g.get("GAME_DATE", ""), reverse=True)
+            sub_a = sub_a.sort_values("GAME_DATE", ascending=False, kind="stable")
+            games_a = sub_a.to_dict("records")
             out["season_series"]["games"] = games_a
-            out["season_series"]["wins_a"] = sum(1 for g in games_a if g.get("WL") == "W")
-            self._rate_limit()
-            log_b = teamgamelog.TeamGameLog(team_id=team_id_b, season=Season.default, timeout=constants.REQUEST_TIMEOUT)
-            df_b = _with_retry(lambda: log_b.get_data_frames()[0])
-            games_b = []
-            for _, row in df_b.iterrows():
-                matchup = str(row.get("MATCHUP", ""))
-                opp = (matchup.split(" vs. ")[1].strip() if " vs. " in matchup else
-                       matchup.split(" @ ")[1].strip() if " @ " in matchup else "")
-                if opp == tricode_a:
-                    games_b.append({"GAME_DATE": row.get("GAME_DATE"), "WL": row.get("WL"), "PTS": row.get("PTS")})
-            out["season_series"]["wins_b"] = sum(1 for g in games_b if g.get("WL") == "W")
+            out["season_series"]["wins_a"] = int((sub_a["WL"] == "W").sum())
+            # Same games from B's side: every A loss is a B win.
+            out["season_series"]["wins_b"] = int((sub_a["WL"] == "L").sum())
             g = games_a[0]
             date_last = g.get("GAME_DATE")
             out["last_meeting"] = {
@@ -588,10 +767,14 @@ class ApiClient:
                 "pts_a": g.get("PTS"),
                 "pts_b": None,
             }
-            for gb in games_b:
-                if gb.get("GAME_DATE") == date_last:
-                    out["last_meeting"]["pts_b"] = gb.get("PTS")
-                    break
+            # B's log is only needed for B's score in the last meeting.
+            self._rate_limit()
+            log_b = teamgamelog.TeamGameLog(team_id=team_id_b, season=Season.default, timeout=constants.REQUEST_TIMEOUT)
+            df_b = _with_retry(lambda: log_b.get_data_frames()[0])
+            sub_b = _games_against(df_b, tricode_a, ["GAME_DATE", "PTS"])
+            pts_b = sub_b.loc[sub_b["GAME_DATE"] == date_last, "PTS"]
+            if not pts_b.empty:
+                out["last_meeting"]["pts_b"] = pts_b.iloc[0]
         except Exception:
             pass
         return out
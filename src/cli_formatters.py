@@ -2,17 +2,17 @@
 from __future__ import annotations
 
 import csv
-import json
 import sys
-from datetime import timezone
 from typing import Any, List, Optional
 
-from dateutil import parser
+import orjson
 
 import config
-from core import format_live_clock
+from core import format_live_clock, parse_utc
 from ui.helpers import format_team_name
 
+csv.register_dialect("nba", delimiter=",", quoting=csv.QUOTE_MINIMAL)
+
 
 def format_game_line(game: dict, tz_info=None) -> str:
     """Format a single game line for CLI output."""
@@ -28,12 +28,12 @@ def format_game_line(game: dict, tz_info=None) -> str:
     if away_s or home_s:
         status = format_live_clock(game) or status
     try:
-        game_time = parser.parse(game["gameTimeUTC"]).replace(tzinfo=timezone.utc)
+        game_time = parse_utc(game["gameTimeUTC"])
         if tz_info:
             game_time = game_time.astimezone(tz_info)
         else:
             game_time = game_time.astimezone(tz=None)
-        time_str = game_time.strftime("%H:%M")
+        time_str = f"{game_time.hour:02d}:{game_time.minute:02d}"
     except Exception:
         time_str = "-"
     placar = f"{away_s} x {home_s}" if (away_s or home_s) else "vs"
@@ -47,12 +47,12 @@ def format_upcoming_team_game(date_str: str, game: dict, tz_info=None) -> str:
     away_name = format_team_name(away)
     home_name = format_team_name(home)
     try:
-        game_time = parser.parse(game.get("gameTimeUTC") or "").replace(tzinfo=timezone.utc)
+        game_time = parse_utc(game.get("gameTimeUTC") or "")
         if tz_info:
             game_time = game_time.astimezone(tz_info)
         else:
             game_time = game_time.astimezone(tz=None)
-        time_str = game_time.strftime("%H:%M")
+        time_str = f"{game_time.hour:02d}:{game_time.minute:02d}"
     except Exception:
         time_str = "--:--"
     return f"{date_str}  {time_str}  {away_name} @ {home_name}"
@@ -67,6 +67,19 @@ def format_past_team_game(row: dict) -> str:
     return f"{date_str}  {matchup}  {wl}  ({pts} pts)"
 
 
+def _standings_records(conf, limit: int = 15) -> List[tuple]:
+    """(rank, team, wins, losses, pct) tuples for the top rows of a conference, read column-wise once."""
+    h = conf.head(limit)
+    teams = (h["TeamCity"].astype(str) + " " + h["TeamName"].astype(str)).tolist()
+    return list(zip(
+        h["PlayoffRank"].to_numpy(dtype=int).tolist(),
+        teams,
+        h["WINS"].to_numpy(dtype=int).tolist(),
+        h["LOSSES"].to_numpy(dtype=int).tolist(),
+        h["WinPCT"].to_numpy(dtype=float).tolist(),
+    ))
+
+
 def print_standings_text(east, west) -> None:
     """Print East/West standings to stdout."""
     def print_conf(conf, title):
@@ -75,11 +88,7 @@ def print_standings_text(east, west) -> None:
         print(title)
         print(f"  {'#':<2} {'Team':<28} {'W':<4} {'L':<4} {'PCT':<6}")
         print("  " + "-" * 46)
-        for _, line in conf.head(15).iterrows():
-            rank = int(line["PlayoffRank"])
-            team = f"{line['TeamCity']} {line['TeamName']}"
-            w, l_ = int(line["WINS"]), int(line["LOSSES"])
-            pct = line["WinPCT"]
+        for rank, team, w, l_, pct in _standings_records(conf):
             print(f"  {rank:<2} {team[:26]:<28} {w:<4} {l_:<4} {pct:.1%}")
         print()
 
@@ -87,55 +96,62 @@ def print_standings_text(east, west) -> None:
     print_conf(west, "=== WEST ===")
 
 
-def export_games_json(games: list, date_str: str) -> None:
+def _print_json(out: Any, compact: bool = False) -> None:
+    """Print out as UTF-8 JSON (orjson): indented by default, minified with compact."""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE | (0 if compact else orjson.OPT_INDENT_2)
+    payload = orjson.dumps(out, option=option)
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is None:
+        sys.stdout.write(payload.decode())
+        return
+    sys.stdout.flush()
+    buf.write(payload)
+    buf.flush()
+
+
+def export_games_json(games: list, date_str: str, compact: bool = False) -> None:
     """Export games to stdout as JSON."""
     out = {"date": date_str, "games": games}
-    print(json.dumps(out, indent=2, ensure_ascii=False))
+    _print_json(out, compact)
 
 
 def export_games_csv(games: list, date_str: str) -> None:
     """Export games to stdout as CSV."""
-    writer = csv.writer(sys.stdout)
+    writer = csv.writer(sys.stdout, dialect="nba")
     writer.writerow(["date", "awayTeam", "homeTeam", "awayScore", "homeScore", "status"])
-    for g in games:
-        away = g.get("awayTeam", {})
-        home = g.get("homeTeam", {})
-        writer.writerow([
+    writer.writerows(
+        (
             date_str,
-            away.get("teamTricode", ""),
-            home.get("teamTricode", ""),
-            away.get("score", ""),
-            home.get("score", ""),
+            g.get("awayTeam", {}).get("teamTricode", ""),
+            g.get("homeTeam", {}).get("teamTricode", ""),
+            g.get("awayTeam", {}).get("score", ""),
+            g.get("homeTeam", {}).get("score", ""),
             g.get("gameStatusText", ""),
-        ])
+        )
+        for g in games
+    )
 
 
-def export_standings_json(east, west) -> None:
+def export_standings_json(east, west, compact: bool = False) -> None:
     """Export standings to stdout as JSON."""
     out = {}
     if east is not None and not east.empty:
         out["east"] = east.to_dict(orient="records")
     if west is not None and not west.empty:
         out["west"] = west.to_dict(orient="records")
-    print(json.dumps(out, indent=2, ensure_ascii=False))
+    _print_json(out, compact)
 
 
 def export_standings_csv(east, west) -> None:
     """Export standings to stdout as CSV."""
-    writer = csv.writer(sys.stdout)
+    writer = csv.writer(sys.stdout, dialect="nba")
     writer.writerow(["conference", "rank", "team", "wins", "losses", "pct"])
     for conf_name, conf in [("East", east), ("West", west)]:
         if conf is not None and not getattr(conf, "empty", True):
-            for _, row in conf.head(15).iterrows():
-                team = f"{row['TeamCity']} {row['TeamName']}"
-                writer.writerow([
-                    conf_name,
-                    int(row["PlayoffRank"]),
-                    team,
-                    int(row["WINS"]),
-                    int(row["LOSSES"]),
-                    f"{row['WinPCT']:.3f}",
-                ])
+            writer.writerows(
+                (conf_name, rank, team, w, l_, f"{pct:.3f}")
+                for rank, team, w, l_, pct in _standings_records(conf)
+            )
 
 
 def _box_score_players_list(game_data: dict) -> List[dict]:
@@ -155,7 +171,7 @@ def _box_score_players_list(game_data: dict) -> List[dict]:
     return out
 
 
-def export_boxscore_json(game_data: dict) -> None:
+def export_boxscore_json(game_data: dict, compact: bool = False) -> None:
     """Export box score to stdout as JSON."""
     away = game_data.get("awayTeam", {})
     home = game_data.get("homeTeam", {})
@@ -181,19 +197,20 @@ def export_boxscore_json(game_data: dict) -> None:
             ],
         },
     }
-    print(json.dumps(out, indent=2, ensure_ascii=False))
+    _print_json(out, compact)
 
 
 def export_boxscore_csv(game_data: dict) -> None:
     """Export box score players to stdout as CSV."""
-    writer = csv.writer(sys.stdout)
+    writer = csv.writer(sys.stdout, dialect="nba")
     writer.writerow(["team", "jersey", "name", "points", "reboundsTotal", "assists", "steals", "blocks", "turnovers"])
+    rows = []
     for side in ("awayTeam", "homeTeam"):
         team = game_data.get(side, {})
         tricode = team.get("teamTricode", "")
         for p in team.get("players", []):
             stats = p.get("statistics", {})
-            writer.writerow([
+            rows.append((
                 tricode,
                 p.get("jerseyNum", ""),
                 p.get("name", ""),
@@ -203,4 +220,5 @@ def export_boxscore_csv(game_data: dict) -> None:
                 stats.get("steals", ""),
                 stats.get("blocks", ""),
                 stats.get("turnovers", ""),
-            ])
+            ))
+    writer.writerows(rows)
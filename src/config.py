@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
-from typing import Any, Literal, Optional
+import tempfile
+from functools import lru_cache
+from typing import Any, Literal, Optional, get_args, get_origin
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, Field
@@ -44,7 +47,33 @@ class AppConfig(BaseModel):
     model_config = {"extra": "ignore"}
 
 
-DEFAULT_CONFIG = AppConfig().model_dump(mode="json")
+DEFAULT_CONFIG = AppConfig().model_dump()
+
+# Allowed values per Literal field, and (min, max) lengths per constrained str field, mirroring AppConfig.
+_LITERAL_CHOICES = {
+    name: get_args(field.annotation)
+    for name, field in AppConfig.model_fields.items()
+    if get_origin(field.annotation) is Literal
+}
+
+
+def _constraint(field: Any, attr: str) -> Any:
+    """A Field(...) bound such as ge or max_length on an AppConfig field, read from its metadata; None if unset."""
+    return next((getattr(m, attr) for m in field.metadata if hasattr(m, attr)), None)
+
+
+_INT_RANGES = {
+    name: (_constraint(field, "ge"), _constraint(field, "le"))
+    for name, field in AppConfig.model_fields.items()
+    if field.annotation is int
+}
+_STR_LENGTHS = {
+    name: (_constraint(field, "min_length") or 0, _constraint(field, "max_length"))
+    for name, field in AppConfig.model_fields.items()
+    if field.annotation is str
+}
+# Strings pydantic's lax int mode accepts: optional sign, digits (single underscores allowed), zero fraction.
+_INT_STR_RE = re.compile(r"[+-]?[0-9](?:_?[0-9])*(?:\.0+)?", re.ASCII)
 
 STRINGS = {
     "en": {
@@ -201,20 +230,22 @@ STRINGS = {
     },
 }
 
+# Per-language strings with English filled in for any missing key, so get_text needs no second lookup.
+_STRINGS_MERGED = {lang: {**STRINGS["en"], **strings} for lang, strings in STRINGS.items()}
+
 
 def get_config_path() -> str:
     return os.path.join(CONFIG_DIR, CONFIG_FILENAME)
 
 
 def load_config() -> dict[str, Any]:
-    """Load config from disk, validate with Pydantic, and return a dict (compatible with the rest of the app)."""
+    """Load config from disk, validate against the AppConfig schema, and return a dict (compatible with the rest of the app)."""
     path = get_config_path()
     if os.path.isfile(path):
         try:
             with open(path, "r", encoding="utf-8") as f:
                 data = json.load(f)
-            model = AppConfig.model_validate(data)
-            return model.model_dump(mode="json")
+            return _validate_cfg(data)
         except (json.JSONDecodeError, OSError, Exception):
             pass
     os.makedirs(CONFIG_DIR, exist_ok=True)
@@ -223,59 +254,130 @@ def load_config() -> dict[str, Any]:
     return cfg
 
 
+def _lax_int(value: Any) -> Optional[int]:
+    """Coerce value to int the way pydantic's lax mode does (bools, integral floats, numeric strings); None if it cannot."""
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else None
+    if isinstance(value, str):
+        text = value.strip()
+        if _INT_STR_RE.fullmatch(text):
+            return int(text.split(".", 1)[0])
+    return None
+
+
+def _validate_cfg(data: Any) -> dict[str, Any]:
+    """
+    Hand-coded equivalent of AppConfig.model_validate(data).model_dump() for this fixed schema
+    and the values JSON can produce (lax int coercion included, see _lax_int).
+    Unknown keys are dropped, missing keys take defaults; raises ValueError on any invalid field.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("config must be an object")
+    out = dict(DEFAULT_CONFIG)
+    for key in out:
+        if key not in data:
+            continue
+        value = data[key]
+        choices = _LITERAL_CHOICES.get(key)
+        if choices is not None:
+            ok = isinstance(value, str) and value in choices
+        elif key in _INT_RANGES:
+            lo, hi = _INT_RANGES[key]
+            number = _lax_int(value)
+            ok = number is not None and (lo is None or number >= lo) and (hi is None or number <= hi)
+            if ok:
+                value = number
+        elif key in _STR_LENGTHS:
+            lo, hi = _STR_LENGTHS[key]
+            ok = isinstance(value, str) and len(value) >= lo and (hi is None or len(value) <= hi)
+        else:
+            ok = value is None or isinstance(value, str)
+        if not ok:
+            raise ValueError(f"invalid config value for {key}: {value!r}")
+        out[key] = value
+    return out
+
+
+def atomic_write(path: str, payload: bytes, fsync: bool = False) -> None:
+    """
+    Write payload to a temp file next to path and rename it over path, so readers never see a partial file.
+    The file keeps the usual 0644 permissions (mkstemp alone would leave it 0600); fsync=True also flushes it to disk.
+    """
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def save_config(config: dict[str, Any]) -> None:
-    """Validate config with Pydantic and write to disk (only valid values are persisted)."""
+    """Validate config against the AppConfig schema and write it atomically to disk (only valid values are persisted)."""
     os.makedirs(CONFIG_DIR, exist_ok=True)
     try:
-        model = AppConfig.model_validate(config)
-        data = model.model_dump(mode="json")
+        data = _validate_cfg(config)
     except Exception:
         data = config
-    with open(get_config_path(), "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    atomic_write(get_config_path(), json.dumps(data, indent=2).encode("utf-8"), fsync=True)
 
 
 def get_text(cfg: Optional[dict], key: str) -> str:
-    lang = (cfg or {}).get("language", "en")
-    return STRINGS.get(lang, STRINGS["en"]).get(key, key)
+    strings = _STRINGS_MERGED.get(cfg.get("language", "en") if cfg else "en") or _STRINGS_MERGED["en"]
+    return strings.get(key, key)
+
+
+def _get(cfg: Optional[dict], key: str) -> Any:
+    """cfg[key], falling back to the AppConfig default when cfg is empty or lacks the key."""
+    return cfg.get(key, DEFAULT_CONFIG[key]) if cfg else DEFAULT_CONFIG[key]
 
 
 def favorite_team(cfg: Optional[dict]) -> str:
-    return (cfg or {}).get("favorite_team", "LAL")
+    return _get(cfg, "favorite_team")
 
 
 def refresh_interval(cfg: Optional[dict]) -> int:
-    return (cfg or {}).get("refresh_interval_seconds", 30)
+    return _get(cfg, "refresh_interval_seconds")
 
 
 def last_game_date(cfg: Optional[dict]) -> Optional[str]:
     """Return the last viewed date (YYYY-MM-DD string) or None."""
-    return (cfg or {}).get("last_game_date")
+    return _get(cfg, "last_game_date")
 
 
 def game_sort(cfg: Optional[dict]) -> str:
     """Return the sort mode: 'time' or 'favorite_first'."""
-    return (cfg or {}).get("game_sort", "time")
+    return _get(cfg, "game_sort")
 
 
 def timezone(cfg: Optional[dict]) -> str:
     """Return the timezone name (e.g. 'America/Sao_Paulo') or 'localtime' for system default."""
-    return (cfg or {}).get("timezone", "localtime")
+    return _get(cfg, "timezone")
 
 
 def theme(cfg: Optional[dict]) -> str:
     """Return the theme: 'default', 'high_contrast', or 'light'."""
-    return (cfg or {}).get("theme", "default")
+    return _get(cfg, "theme")
 
 
 def refresh_mode(cfg: Optional[dict]) -> str:
     """Return the refresh mode: 'fixed' or 'auto'."""
-    return (cfg or {}).get("refresh_mode", "fixed")
+    return _get(cfg, "refresh_mode")
 
 
 def layout_mode(cfg: Optional[dict]) -> str:
     """Return the layout mode: 'auto', 'compact', or 'wide'."""
-    return (cfg or {}).get("layout_mode", "auto")
+    return _get(cfg, "layout_mode")
 
 
 def get_tzinfo(cfg: Optional[dict]) -> Optional[ZoneInfo]:
@@ -283,6 +385,12 @@ def get_tzinfo(cfg: Optional[dict]) -> Optional[ZoneInfo]:
     tz_name = timezone(cfg)
     if not tz_name or tz_name == "localtime":
         return None
+    return _zoneinfo(tz_name)
+
+
+@lru_cache(maxsize=64)
+def _zoneinfo(tz_name: str) -> Optional[ZoneInfo]:
+    """ZoneInfo for a name, or None if invalid; cached so renders and bad names skip the lookup."""
     try:
         return ZoneInfo(tz_name)
     except Exception:
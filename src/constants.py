@@ -1,4 +1,6 @@
 """Constants: team mapping (tricode, name, colors), stats, and fun facts."""
+from functools import lru_cache
+
 TEAM_TO_TRICODE = {
     "Atlanta Hawks": "ATL", "Boston Celtics": "BOS", "Brooklyn Nets": "BKN",
     "Charlotte Hornets": "CHA", "Chicago Bulls": "CHI", "Cleveland Cavaliers": "CLE",
@@ -13,7 +15,19 @@ TEAM_TO_TRICODE = {
     "Toronto Raptors": "TOR", "Utah Jazz": "UTA", "Washington Wizards": "WAS",
 }
 
-TRICODE_TO_TEAM_NAME = {v: k for k, v in TEAM_TO_TRICODE.items()}
+# Canonical display name per tricode (TEAM_TO_TRICODE also holds aliases such as "LA Lakers").
+TRICODE_TO_TEAM_NAME = {
+    "ATL": "Atlanta Hawks", "BOS": "Boston Celtics", "BKN": "Brooklyn Nets",
+    "CHA": "Charlotte Hornets", "CHI": "Chicago Bulls", "CLE": "Cleveland Cavaliers",
+    "DAL": "Dallas Mavericks", "DEN": "Denver Nuggets", "DET": "Detroit Pistons",
+    "GSW": "Golden State Warriors", "HOU": "Houston Rockets", "IND": "Indiana Pacers",
+    "LAC": "Los Angeles Clippers", "LAL": "Los Angeles Lakers", "MEM": "Memphis Grizzlies",
+    "MIA": "Miami Heat", "MIL": "Milwaukee Bucks", "MIN": "Minnesota Timberwolves",
+    "NOP": "New Orleans Pelicans", "NYK": "New York Knicks", "OKC": "Oklahoma City Thunder",
+    "ORL": "Orlando Magic", "PHI": "Philadelphia 76ers", "PHX": "Phoenix Suns",
+    "POR": "Portland Trail Blazers", "SAC": "Sacramento Kings", "SAS": "San Antonio Spurs",
+    "TOR": "Toronto Raptors", "UTA": "Utah Jazz", "WAS": "Washington Wizards",
+}
 
 TEAM_COLORS_RGB = {
     "ATL": (224, 58, 62), "BOS": (0, 122, 51), "BKN": (128, 128, 128),
@@ -52,6 +66,8 @@ TRICODE_TO_TEAM_ID = {
     "UTA": 1610612762, "WAS": 1610612764,
 }
 
+TEAM_ID_TO_TRICODE = {tid: t for t, tid in TRICODE_TO_TEAM_ID.items()}
+
 TEAM_FUN_FACTS = {
     "LAL": "17 NBA titles. 33-game win streak in 1971-72. Showtime in the 80s.",
     "BOS": "18 titles (record). Bill Russell dynasty: 11 in 13 years.",
@@ -110,15 +126,24 @@ REFRESH_INTERVAL_CHOICES = [10, 15, 30, 60, 120, 0]
 
 CACHE_TTL_STANDINGS = 3600
 CACHE_TTL_GAMES = 90
+CACHE_TTL_GAMES_LIVE = 20
 CACHE_TTL_LEAGUE_LEADERS = 3600
 CACHE_TTL_BOX_SCORE = 300
+CACHE_TTL_FINAL = 86400
+CACHE_TTL_TEAM = 3600
+CACHE_TTL_SCHEDULE = 3600
+CACHE_TTL_TRIPLE_DOUBLES = 86400
+CACHE_TTL_NEGATIVE = 60
 RETRY_MAX_ATTEMPTS = 3
 RETRY_BASE_DELAY = 1
 RATE_LIMIT_MIN_INTERVAL = 0.6
+MAX_CONCURRENT_REQUESTS = 2
 REQUEST_TIMEOUT = 20
 INITIAL_LOAD_TIMEOUT = 10
 CACHE_READ_TIMEOUT = 3
 CACHE_TTL_OFFLINE = 86400
+CONFIG_SAVE_DEBOUNCE = 2.0
+UI_BUSY_TIMEOUT_MS = 500
 
 SPLASH_STARTING = "Starting..."
 SPLASH_LOADING_GAMES = "Loading games..."
@@ -126,22 +151,33 @@ SPLASH_LOADING_STANDINGS = "Loading standings..."
 SPLASH_LOADING_LEADERS = "Loading league leaders..."
 SPLASH_PLEASE_WAIT = " Please wait... "
 
+# (name, tricode) pairs longest name first, so a substring match picks the most specific team.
+_TEAM_NAMES_BY_LENGTH = tuple(sorted(TEAM_TO_TRICODE.items(), key=lambda kv: len(kv[0]), reverse=True))
 
+
+@lru_cache(maxsize=256)
 def get_tricode_from_team(team_full):
-    for name, tricode in TEAM_TO_TRICODE.items():
-        if name in team_full or (team_full or "").strip() == name:
+    if not team_full:
+        return ""
+    tricode = TEAM_TO_TRICODE.get(team_full.strip())
+    if tricode:
+        return tricode
+    for name, tricode in _TEAM_NAMES_BY_LENGTH:
+        if name in team_full:
             return tricode
     return ""
 
 
+_TRIPLE_DOUBLE_STATS = ("points", "reboundsTotal", "assists", "steals", "blocks")
+
+
 def is_triple_double(stats):
     if not stats:
         return False
-    vals = [
-        stats.get("points") or 0,
-        stats.get("reboundsTotal") or 0,
-        stats.get("assists") or 0,
-        stats.get("steals") or 0,
-        stats.get("blocks") or 0,
-    ]
-    return sum(1 for v in vals if v >= 10) >= 3
+    count = 0
+    for key in _TRIPLE_DOUBLE_STATS:
+        if (stats.get(key) or 0) >= 10:
+            count += 1
+            if count == 3:
+                return True
+    return False
@@ -1,7 +1,18 @@
 """Pure business logic: game categorization, clock formatting, and labels. UI imports from here."""
 from __future__ import annotations
 
-from typing import Any, List, Tuple
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+_UTC_PARSE_CACHE: Dict[str, datetime] = {}
+_UTC_PARSE_CACHE_MAX = 4096
+_UTC = timezone.utc
+_FINAL_STATUSES = frozenset(("Final", "Final/OT"))
+_EMPTY: Dict[str, Any] = {}
+# ISO-8601 duration game clock, e.g. "PT05M30.00S" or "PT12.5S".
+_CLOCK_RE = re.compile(r"PT(?:(\d+(?:\.\d+)?)M)?(\d+(?:\.\d+)?)S")
 
 
 def categorize_games(games: List[dict]) -> Tuple[List[dict], List[dict], List[dict]]:
@@ -10,46 +21,62 @@ def categorize_games(games: List[dict]) -> Tuple[List[dict], List[dict], List[di
     Returns (in_progress, not_started, finished).
     """
     em_andamento, nao_comecaram, finalizados = [], [], []
+    add_live, add_upcoming, add_final = em_andamento.append, nao_comecaram.append, finalizados.append
+    final_statuses = _FINAL_STATUSES
     for g in games:
-        status = g.get("gameStatusText", "")
-        away_score = g.get("awayTeam", {}).get("score", 0)
-        home_score = g.get("homeTeam", {}).get("score", 0)
-        if status in ("Final", "Final/OT"):
-            finalizados.append(g)
-        elif away_score or home_score:
-            em_andamento.append(g)
+        if g.get("gameStatusText", "") in final_statuses:
+            add_final(g)
+        elif (g.get("awayTeam") or _EMPTY).get("score", 0) or (g.get("homeTeam") or _EMPTY).get("score", 0):
+            add_live(g)
         else:
-            nao_comecaram.append(g)
+            add_upcoming(g)
     return em_andamento, nao_comecaram, finalizados
 
 
 def format_live_clock(game: dict) -> str:
     """Format the game clock (e.g. Q3 5:30) from gameStatusText, period, and gameClock."""
-    status = game.get("gameStatusText", "")
+    return _format_clock(game.get("gameStatusText", ""), game.get("period", 0), game.get("gameClock", ""))
+
+
+@lru_cache(maxsize=256)
+def _format_clock(status: str, period: int, clock: str) -> str:
+    """Pure part of format_live_clock, memoized: a live game's clock only changes with a new payload."""
     if status and (status.startswith("Q") or ":" in status or "Halftime" in status):
         return status
-    period = game.get("period", 0)
-    clock = game.get("gameClock", "")
     if clock and period:
-        s = str(clock)
-        mins = 0
-        if "M" in s:
-            parts = s.replace("PT", "").replace("S", "").split("M")
-            if len(parts) >= 2:
-                mins = int(float(parts[0])) if parts[0] else 0
-                s = parts[1]
+        m = _CLOCK_RE.match(str(clock))
         try:
-            secs = int(float(s))
+            if m:
+                mins = int(float(m.group(1) or 0))
+                secs = int(float(m.group(2)))
+            else:
+                mins, secs = 0, int(float(clock))
             return f"Q{period} {mins}:{secs:02d}"
         except (ValueError, TypeError):
             pass
     return status or "-"
 
 
+_GAME_LABELS = tuple(f" [{ch}] " for ch in "1234567890abcdefghij")
+
+
 def game_index_label(i: int) -> str:
     """Key label for the game at index i: [1]..[9], [0], [a]..[j]."""
-    if i < 9:
-        return f" [{i+1}] "
-    if i == 9:
-        return " [0] "
+    if 0 <= i < len(_GAME_LABELS):
+        return _GAME_LABELS[i]
     return f" [{chr(ord('a') + i - 10)}] "
+
+
+def parse_utc(value: str) -> datetime:
+    """
+    Parse an ISO-8601 UTC timestamp such as gameTimeUTC ("2025-02-16T00:30:00Z") into an aware UTC datetime.
+    Memoized per string, since the same game times are re-parsed on every refresh. Raises ValueError if not ISO.
+    """
+    dt = _UTC_PARSE_CACHE.get(value)
+    if dt is None:
+        s = value[:-1] if value.endswith("Z") else value
+        dt = datetime.fromisoformat(s).replace(tzinfo=_UTC)
+        if len(_UTC_PARSE_CACHE) >= _UTC_PARSE_CACHE_MAX:
+            _UTC_PARSE_CACHE.clear()
+        _UTC_PARSE_CACHE[value] = dt
+    return dt
@@ -5,6 +5,35 @@ import curses
 from typing import Optional
 
 
+_KEY_ACTIONS = (
+    ("qQ", "quit"),
+    ("rR", "refresh"),
+    ("cC", "config"),
+    ("?hH", "help"),
+    ("fF", "filter"),
+    ("tT", "teams"),
+    ("gG", "date"),
+    ("lL", "favorite_team"),
+    ("dD", "today"),
+    (",[", "prev_day"),
+    (".]", "next_day"),
+)
+
+# Static key -> action table, built once; game-index keys (1-9, 0, a-j) are resolved after a miss.
+_KEY_TO_ACTION = {ord(ch): action for chars, action in _KEY_ACTIONS for ch in chars}
+_KEY_TO_ACTION.update({
+    curses.KEY_LEFT: "prev_day",
+    curses.KEY_RIGHT: "next_day",
+    curses.KEY_UP: "scroll_up",
+    curses.KEY_DOWN: "scroll_down",
+})
+
+_GAME_ACTIONS = tuple(f"game:{i}" for i in range(20))
+
+# Game-index keys: 1-9 -> 0-8, 0 -> 9, a-j -> 10-19.
+_KEY_TO_GAME_IDX = {ord(ch): i for i, ch in enumerate("1234567890abcdefghij")}
+
+
 def get_action(key: int, game_count: int = 0) -> Optional[str]:
     """
     Convert curses key code to action string.
@@ -15,45 +44,8 @@ def get_action(key: int, game_count: int = 0) -> Optional[str]:
     """
     if key == -1:
         return None
-    if key in (ord("q"), ord("Q")):
-        return "quit"
-    if key in (ord("r"), ord("R")):
-        return "refresh"
-    if key in (ord("c"), ord("C")):
-        return "config"
-    if key in (ord("?"), ord("h"), ord("H")):
-        return "help"
-    if key in (ord("f"), ord("F")):
-        return "filter"
-    if key in (ord("t"), ord("T")):
-        return "teams"
-    if key in (ord("g"), ord("G")):
-        return "date"
-    if key in (ord("l"), ord("L")):
-        return "favorite_team"
-    if key in (ord("d"), ord("D")):
-        return "today"
-    if key in (ord(","), ord("["), curses.KEY_LEFT):
-        return "prev_day"
-    if key in (ord("."), ord("]"), curses.KEY_RIGHT):
-        return "next_day"
-    if key == curses.KEY_UP:
-        return "scroll_up"
-    if key == curses.KEY_DOWN:
-        return "scroll_down"
-    if ord("1") <= key <= ord("9"):
-        idx = key - ord("1")
-        if 0 <= idx < game_count:
-            return f"game:{idx}"
-        return None
-    if key == ord("0"):
-        idx = 9
-        if idx < game_count:
-            return f"game:{idx}"
-        return None
-    if ord("a") <= key <= ord("j"):
-        idx = 10 + (key - ord("a"))
-        if idx < game_count:
-            return f"game:{idx}"
-        return None
-    return None
+    action = _KEY_TO_ACTION.get(key)
+    if action:
+        return action
+    idx = _KEY_TO_GAME_IDX.get(key, -1)
+    return _GAME_ACTIONS[idx] if 0 <= idx < game_count else None
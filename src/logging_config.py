@@ -11,6 +11,12 @@ def setup_logging():
         level=LOG_LEVEL,
         format="%(levelname)s [%(name)s] %(message)s",
     )
+    # The format uses no thread/process fields, so skip collecting them for each record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if LOG_LEVEL > logging.INFO:
+        logging.disable(logging.INFO)
 
 
 def get_logger(name):
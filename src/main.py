@@ -5,14 +5,15 @@ from __future__ import annotations
 
 import curses
 import os
+import queue
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from types import SimpleNamespace
 from typing import Optional
-from datetime import datetime, timezone, timedelta
-from dateutil import parser
+from datetime import date, datetime, timedelta
 
 # Ensure src directory is on path so "import config" etc. work when run as python -m src.main
 if __package__ == "src":
@@ -35,7 +36,68 @@ from ui.help import show_help
 import cli_formatters
 
 
-def main(stdscr, cfg, api_client, color_ctx):
+DayGames = namedtuple("DayGames", "games scoreboard_date in_progress not_started finished")
+
+
+def _day_games(games: list, scoreboard_date: str) -> DayGames:
+    """Categorize a day's games once (in progress, not started, finished)."""
+    return DayGames(games, scoreboard_date, *categorize_games(games))
+
+
+class _DaemonPool(Executor):
+    """
+    Fixed-size executor whose workers are daemon threads. ThreadPoolExecutor joins its workers at
+    interpreter exit, so a fetch stuck on an unresponsive server would keep the app alive after quit.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str) -> None:
+        self._work: queue.SimpleQueue = queue.SimpleQueue()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{thread_name_prefix}_{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            fut, fn, args, kwargs = item
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                fut.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                fut.set_exception(e)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        fut: Future = Future()
+        self._work.put((fut, fn, args, kwargs))
+        return fut
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._work.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self._threads:
+            self._work.put(None)
+        if wait:
+            for t in self._threads:
+                t.join()
+
+
+def main(stdscr, cfg, api_client, color_ctx, pool):
     curses.curs_set(0)
     stdscr.nodelay(True)
     stdscr.timeout(500)
@@ -52,7 +114,7 @@ def main(stdscr, cfg, api_client, color_ctx):
     saved_date = config.last_game_date(cfg)
     if saved_date:
         try:
-            game_date = datetime.strptime(saved_date, "%Y-%m-%d").date()
+            game_date = date.fromisoformat(saved_date)
             if game_date > today:
                 game_date = today
         except (ValueError, TypeError):
@@ -64,33 +126,29 @@ def main(stdscr, cfg, api_client, color_ctx):
     draw_splash(stdscr, constants.SPLASH_LOADING_GAMES)
     stdscr.refresh()
 
-    result_holder: list = [None]
-    load_error_holder: list = [None]
-
-    def load_initial_data() -> None:
-        try:
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                fut_games = executor.submit(api_client.fetch_games, game_date_iso)
-                fut_standings = executor.submit(api_client.fetch_standings)
-                fut_leaders = executor.submit(api_client.fetch_league_leaders)
-                games, scoreboard_date = fut_games.result()
-                east, west = fut_standings.result()
-                league_leaders = fut_leaders.result()
-            result_holder[0] = (games, scoreboard_date, east, west, league_leaders)
-        except Exception as e:
-            load_error_holder[0] = e
-
-    load_thread = threading.Thread(target=load_initial_data, daemon=True)
-    load_thread.start()
-    waited = 0
-    while load_thread.is_alive() and waited < constants.INITIAL_LOAD_TIMEOUT:
-        load_thread.join(timeout=0.08)
-        waited += 0.08
-        if load_thread.is_alive():
+    # The initial load gets its own daemon workers: if it times out, the stragglers neither hold
+    # session pool workers (delaying the first [R]) nor block exit.
+    init_pool = _DaemonPool(max_workers=3, thread_name_prefix="nba-init")
+    futures = (
+        init_pool.submit(api_client.fetch_games, game_date_iso),
+        init_pool.submit(api_client.fetch_standings),
+        init_pool.submit(api_client.fetch_league_leaders),
+    )
+    init_pool.shutdown(wait=False)
+    deadline = time.monotonic() + constants.INITIAL_LOAD_TIMEOUT
+    pending = set(futures)
+    failed = False
+    while pending and not failed:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=min(0.08, remaining), return_when=FIRST_COMPLETED)
+        failed = any(f.exception() is not None for f in done)
+        if pending and not failed:
             progress = (time.time() * 2) % 1.0
             draw_splash(stdscr, constants.SPLASH_LOADING_GAMES, progress=progress)
-    if result_holder[0] is not None:
-        games, scoreboard_date, east, west, league_leaders = result_holder[0]
+    if not pending and not failed:
+        (games, scoreboard_date), (east, west), league_leaders = (f.result() for f in futures)
     else:
         cache_holder: list = [None]
         def read_cache() -> None:
@@ -111,131 +169,173 @@ def main(stdscr, cfg, api_client, color_ctx):
         if not games and east is None and west is None:
             api_client._last_error = "Connection timed out or unavailable. Press [R] to retry."
 
-    em_andamento, nao_comecaram, finalizados = categorize_games(games)
-    game_list = em_andamento + nao_comecaram + finalizados
+    games, scoreboard_date, em_andamento, nao_comecaram, finalizados = _day_games(games, scoreboard_date)
 
     last_refresh = time.time()
     filter_favorite_only = False
-    game_sort_mode = config.game_sort(cfg)
     standings_scroll = 0
     refresh_in_progress = False
+    # last_game_date changes from date navigation are written at most every CONFIG_SAVE_DEBOUNCE seconds.
+    date_dirty = False
+    last_save = 0.0
+
+    def _read_prefs():
+        """Config values the loop reads every tick; re-read only after the settings screen."""
+        return config.refresh_interval(cfg), config.refresh_mode(cfg), config.game_sort(cfg), config.get_tzinfo(cfg)
+
+    refresh_base, refresh_mode, game_sort_mode, tz_info = _read_prefs()
 
     def _effective_refresh_interval(has_live: bool) -> int:
-        base = config.refresh_interval(cfg)
-        if base == 0:
+        if refresh_base == 0:
             return 0
-        if config.refresh_mode(cfg) == "auto":
+        if refresh_mode == "auto":
             return 30 if has_live else 120
-        return base
-
-    tz_info = config.get_tzinfo(cfg)
-
-    while True:
-        refresh_interval = _effective_refresh_interval(bool(em_andamento))
-        result = draw_dashboard(
-            stdscr, games, scoreboard_date, east, west, game_date.isoformat(), cfg, api_client, color_ctx,
-            last_refresh=last_refresh, league_leaders=league_leaders,
-            filter_favorite_only=filter_favorite_only, game_sort=game_sort_mode,
-            tz_info=tz_info, standings_scroll=standings_scroll,
-            refresh_in_progress=refresh_in_progress,
-        )
-        game_list, max_standings_scroll = result[0], result[1] if isinstance(result, tuple) else 0
-
+        return refresh_base
+
+    def _reload(date_iso: str) -> DayGames:
+        """Fetch and categorize the games for date_iso."""
+        return _day_games(*api_client.fetch_games(date_iso))
+
+    def _key_wait_ms(refresh_interval: int) -> int:
+        """How long getch may block: poll while a refresh is in flight, else sleep until the next due work."""
+        if refresh_in_progress or auto_refresh_inflight:
+            return constants.UI_BUSY_TIMEOUT_MS
+        # Wake at least at the next whole second so the HH:MM:SS header clock keeps ticking.
+        wait_s = 1.0 - time.time() % 1.0
+        if refresh_interval > 0 and em_andamento:
+            wait_s = min(wait_s, last_refresh + refresh_interval - time.time())
+        if date_dirty:
+            wait_s = min(wait_s, last_save + constants.CONFIG_SAVE_DEBOUNCE - time.monotonic())
+        return max(0, int(wait_s * 1000))
+
+    def _prefetch_adjacent(day) -> None:
+        """Warm the games cache for the days either side of day, so the next [,]/[.] press is a cache hit."""
+        for delta in (-1, 1):
+            pool.submit(api_client.prefetch_games, (day + timedelta(days=delta)).isoformat())
+
+    def _go_to(day, prefetch: bool = True) -> None:
+        """Show the games for day: remember it (debounced save), reload, and optionally warm the neighbouring days."""
+        nonlocal game_date, game_date_iso, date_dirty, last_refresh
+        nonlocal games, scoreboard_date, em_andamento, nao_comecaram, finalizados
+        game_date = day
+        game_date_iso = day.isoformat()
+        cfg["last_game_date"] = game_date_iso
+        date_dirty = True
+        games, scoreboard_date, em_andamento, nao_comecaram, finalizados = _reload(game_date_iso)
+        last_refresh = time.time()
+        if prefetch:
+            _prefetch_adjacent(day)
+
+    # Auto-refresh runs on a pool worker so the loop keeps handling keys; results arrive through refresh_q.
+    refresh_q: queue.Queue = queue.Queue()
+    auto_refresh_inflight = False
+
+    def _background_reload(date_iso: str) -> None:
         try:
-            key = stdscr.getch()
+            refresh_q.put((date_iso, _reload(date_iso)))
         except Exception:
-            key = -1
+            refresh_q.put((date_iso, None))
 
-        action = get_action(key, len(game_list))
+    # Flush a pending debounced date save on every exit path (quit, Ctrl-C, errors).
+    try:
+        while True:
+            if date_dirty and time.monotonic() - last_save >= constants.CONFIG_SAVE_DEBOUNCE:
+                config.save_config(cfg)
+                date_dirty = False
+                last_save = time.monotonic()
+            try:
+                done_date, reloaded = refresh_q.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                auto_refresh_inflight = False
+                last_refresh = time.time()
+                if reloaded is not None and done_date == game_date_iso:
+                    games, scoreboard_date, em_andamento, nao_comecaram, finalizados = reloaded
+            refresh_interval = _effective_refresh_interval(bool(em_andamento))
+            result = draw_dashboard(
+                stdscr, games, scoreboard_date, east, west, game_date_iso, cfg, api_client, color_ctx,
+                last_refresh=last_refresh, league_leaders=league_leaders,
+                filter_favorite_only=filter_favorite_only, game_sort=game_sort_mode,
+                tz_info=tz_info, standings_scroll=standings_scroll,
+                refresh_in_progress=refresh_in_progress or auto_refresh_inflight,
+            )
+            game_list, max_standings_scroll = result[0], result[1] if isinstance(result, tuple) else 0
 
-        if action == "quit":
-            break
-        if action == "refresh":
-            refresh_in_progress = True
+            stdscr.timeout(_key_wait_ms(refresh_interval))
             try:
-                with ThreadPoolExecutor(max_workers=3) as executor:
-                    fut_games = executor.submit(api_client.fetch_games, game_date.isoformat())
-                    fut_standings = executor.submit(api_client.fetch_standings)
-                    fut_leaders = executor.submit(api_client.fetch_league_leaders)
+                key = stdscr.getch()
+            except Exception:
+                key = -1
+
+            action = get_action(key, len(game_list))
+
+            if action == "quit":
+                break
+            if action == "refresh":
+                refresh_in_progress = True
+                try:
+                    fut_games = pool.submit(api_client.fetch_games, game_date_iso)
+                    fut_standings = pool.submit(api_client.fetch_standings)
+                    fut_leaders = pool.submit(api_client.fetch_league_leaders)
                     games, scoreboard_date = fut_games.result()
                     east, west = fut_standings.result()
                     league_leaders = fut_leaders.result()
-                em_andamento, nao_comecaram, finalizados = categorize_games(games)
-                game_list = em_andamento + nao_comecaram + finalizados
-                last_refresh = time.time()
-            finally:
-                refresh_in_progress = False
-        elif key == -1 and refresh_interval > 0 and em_andamento and (time.time() - last_refresh) >= refresh_interval:
-            games, scoreboard_date = api_client.fetch_games(game_date.isoformat())
-            em_andamento, nao_comecaram, finalizados = categorize_games(games)
-            game_list = em_andamento + nao_comecaram + finalizados
-            last_refresh = time.time()
-        elif action == "config":
-            stdscr.nodelay(False)
-            show_config_screen(stdscr, cfg)
-            game_sort_mode = config.game_sort(cfg)
-            color_ctx.set_theme(config.theme(cfg))
-            color_ctx.init_pairs()
-            stdscr.nodelay(True)
-        elif action == "help":
-            stdscr.nodelay(False)
-            show_help(stdscr, cfg)
-            stdscr.nodelay(True)
-        elif action == "filter":
-            filter_favorite_only = not filter_favorite_only
-        elif action == "teams":
-            stdscr.nodelay(False)
-            show_teams_picker(stdscr, east, west, cfg, color_ctx, api_client)
-            stdscr.nodelay(True)
-        elif action == "date":
-            target_date = prompt_date(stdscr, game_date)
-            if target_date:
-                game_date = target_date
-                cfg["last_game_date"] = game_date.isoformat()
-                config.save_config(cfg)
-                games, scoreboard_date = api_client.fetch_games(game_date.isoformat())
-                em_andamento, nao_comecaram, finalizados = categorize_games(games)
-                game_list = em_andamento + nao_comecaram + finalizados
-                last_refresh = time.time()
-        elif action == "favorite_team":
-            stdscr.nodelay(False)
-            tricode = config.favorite_team(cfg)
-            team_name = constants.TRICODE_TO_TEAM_NAME.get(tricode, tricode)
-            show_team_page(stdscr, tricode, team_name, cfg, color_ctx, api_client)
-            stdscr.nodelay(True)
-        elif action == "today":
-            game_date = datetime.now().date()
-            cfg["last_game_date"] = game_date.isoformat()
-            config.save_config(cfg)
-            games, scoreboard_date = api_client.fetch_games(game_date.isoformat())
-            em_andamento, nao_comecaram, finalizados = categorize_games(games)
-            game_list = em_andamento + nao_comecaram + finalizados
-            last_refresh = time.time()
-        elif action == "prev_day":
-            game_date -= timedelta(days=1)
-            cfg["last_game_date"] = game_date.isoformat()
-            config.save_config(cfg)
-            games, scoreboard_date = api_client.fetch_games(game_date.isoformat())
-            em_andamento, nao_comecaram, finalizados = categorize_games(games)
-            game_list = em_andamento + nao_comecaram + finalizados
-            last_refresh = time.time()
-        elif action == "next_day":
-            game_date += timedelta(days=1)
-            cfg["last_game_date"] = game_date.isoformat()
+                    games, scoreboard_date, em_andamento, nao_comecaram, finalizados = _day_games(games, scoreboard_date)
+                    last_refresh = time.time()
+                finally:
+                    refresh_in_progress = False
+            elif (
+                key == -1 and refresh_interval > 0 and em_andamento and not auto_refresh_inflight
+                and (time.time() - last_refresh) >= refresh_interval
+            ):
+                auto_refresh_inflight = True
+                pool.submit(_background_reload, game_date_iso)
+            elif action == "config":
+                stdscr.nodelay(False)
+                show_config_screen(stdscr, cfg)
+                refresh_base, refresh_mode, game_sort_mode, tz_info = _read_prefs()
+                color_ctx.set_theme(config.theme(cfg))
+                color_ctx.init_pairs()
+                stdscr.nodelay(True)
+            elif action == "help":
+                stdscr.nodelay(False)
+                show_help(stdscr, cfg)
+                stdscr.nodelay(True)
+            elif action == "filter":
+                filter_favorite_only = not filter_favorite_only
+            elif action == "teams":
+                stdscr.nodelay(False)
+                show_teams_picker(stdscr, east, west, cfg, color_ctx, api_client)
+                stdscr.nodelay(True)
+            elif action == "date":
+                target_date = prompt_date(stdscr, game_date)
+                if target_date:
+                    _go_to(target_date)
+            elif action == "favorite_team":
+                stdscr.nodelay(False)
+                tricode = config.favorite_team(cfg)
+                team_name = constants.TRICODE_TO_TEAM_NAME.get(tricode, tricode)
+                show_team_page(stdscr, tricode, team_name, cfg, color_ctx, api_client)
+                stdscr.nodelay(True)
+            elif action == "today":
+                _go_to(datetime.now().date(), prefetch=False)
+            elif action == "prev_day":
+                _go_to(game_date - timedelta(days=1))
+            elif action == "next_day":
+                _go_to(game_date + timedelta(days=1))
+            elif action == "scroll_up" and max_standings_scroll > 0:
+                standings_scroll = max(0, standings_scroll - 1)
+            elif action == "scroll_down" and max_standings_scroll > 0:
+                standings_scroll = min(max_standings_scroll, standings_scroll + 1)
+            elif action and action.startswith("game:"):
+                idx = int(action.split(":")[1])
+                stdscr.nodelay(False)
+                show_game_stats(stdscr, game_list[idx], cfg, color_ctx, api_client)
+                stdscr.nodelay(True)
+    finally:
+        if date_dirty:
             config.save_config(cfg)
-            games, scoreboard_date = api_client.fetch_games(game_date.isoformat())
-            em_andamento, nao_comecaram, finalizados = categorize_games(games)
-            game_list = em_andamento + nao_comecaram + finalizados
-            last_refresh = time.time()
-        elif action == "scroll_up" and max_standings_scroll > 0:
-            standings_scroll = max(0, standings_scroll - 1)
-        elif action == "scroll_down" and max_standings_scroll > 0:
-            standings_scroll = min(max_standings_scroll, standings_scroll + 1)
-        elif action and action.startswith("game:"):
-            idx = int(action.split(":")[1])
-            stdscr.nodelay(False)
-            show_game_stats(stdscr, game_list[idx], cfg, color_ctx, api_client)
-            stdscr.nodelay(True)
 
 
 def run_cli(args, api_client):
@@ -244,14 +344,14 @@ def run_cli(args, api_client):
     if getattr(args, "export_games", None):
         games, date_str = api_client.fetch_games()
         if args.export_games == "json":
-            cli_formatters.export_games_json(games or [], date_str or "")
+            cli_formatters.export_games_json(games or [], date_str or "", compact=getattr(args, "compact", False))
         else:
             cli_formatters.export_games_csv(games or [], date_str or "")
         return
     if getattr(args, "export_standings", None):
         east, west = api_client.fetch_standings()
         if args.export_standings == "json":
-            cli_formatters.export_standings_json(east, west)
+            cli_formatters.export_standings_json(east, west, compact=getattr(args, "compact", False))
         else:
             cli_formatters.export_standings_csv(east, west)
         return
@@ -266,7 +366,7 @@ def run_cli(args, api_client):
             print("Error: box score not found or failed to load.", file=sys.stderr)
             return
         if fmt == "json":
-            cli_formatters.export_boxscore_json(game_data)
+            cli_formatters.export_boxscore_json(game_data, compact=getattr(args, "compact", False))
         else:
             cli_formatters.export_boxscore_csv(game_data)
         return
@@ -344,10 +444,15 @@ def run():
     cfg = config.load_config()
     api_client = api.ApiClient()
     color_ctx = colors.ColorContext(theme=config.theme(cfg))
+    # One I/O pool for the whole session: initial load, manual refresh and background auto-refresh.
+    # Daemon workers, so quitting never waits for an in-flight network call.
+    pool = _DaemonPool(max_workers=4, thread_name_prefix="nba-io")
     try:
-        curses.wrapper(lambda stdscr: main(stdscr, cfg, api_client, color_ctx))
+        curses.wrapper(lambda stdscr: main(stdscr, cfg, api_client, color_ctx, pool))
     except KeyboardInterrupt:
         pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
     print("Goodbye! 🏀")
 
 
@@ -379,6 +484,7 @@ def main_callback(
     export_standings: Optional[str] = typer.Option(None, "-x", "--export-standings", help="Export standings: json or csv"),
     export_boxscore: Optional[str] = typer.Option(None, "-b", "--export-boxscore", help="Export box score by game ID (e.g. 0042400123)"),
     export_boxscore_format: Optional[str] = typer.Option("json", "--export-boxscore-format", help="Format for --export-boxscore: json or csv"),
+    compact: bool = typer.Option(False, "--compact", help="Minified JSON for exports (no indentation)"),
 ) -> None:
     if export_games is not None and export_games not in ("json", "csv"):
         raise typer.BadParameter("--export-games must be json or csv")
@@ -404,6 +510,7 @@ def main_callback(
             export_standings=export_standings,
             export_boxscore=export_boxscore,
             export_boxscore_format=export_boxscore_format or "json",
+            compact=compact,
         )
         run_cli(args, api.ApiClient())
     else:
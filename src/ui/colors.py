@@ -7,6 +7,15 @@ TRICODE_TO_BASIC_COLOR = {
     k: getattr(curses, v) for k, v in constants.TRICODE_TO_BASIC_COLOR_NAMES.items()
 }
 
+# Precomputed per-tricode lookups: true-color slot (order of TEAM_COLORS_RGB) and basic-mode pair number.
+_TRICODE_COLOR_INDEX = {t: i for i, t in enumerate(constants.TEAM_COLORS_RGB)}
+_BASIC_COLOR_PAIR = {
+    curses.COLOR_RED: 1, curses.COLOR_GREEN: 2, curses.COLOR_YELLOW: 3,
+    curses.COLOR_BLUE: 4, curses.COLOR_MAGENTA: 5, curses.COLOR_CYAN: 6,
+    curses.COLOR_WHITE: 7,
+}
+_TRICODE_BASIC_PAIR = {t: _BASIC_COLOR_PAIR.get(c, 7) for t, c in TRICODE_TO_BASIC_COLOR.items()}
+
 
 class ColorContext:
     def __init__(self, theme="default"):
@@ -73,27 +82,17 @@ class ColorContext:
             return 1
         tricode = tricode.upper()
         if self._pair_mode == "truecolor":
-            tricodes = list(constants.TEAM_COLORS_RGB.keys())
-            if tricode in tricodes:
-                return min(tricodes.index(tricode) + 1, 30)
-            return 7
-        color = TRICODE_TO_BASIC_COLOR.get(tricode, curses.COLOR_WHITE)
-        return {curses.COLOR_RED: 1, curses.COLOR_GREEN: 2, curses.COLOR_YELLOW: 3,
-                curses.COLOR_BLUE: 4, curses.COLOR_MAGENTA: 5, curses.COLOR_CYAN: 6,
-                curses.COLOR_WHITE: 7}.get(color, 7)
+            idx = _TRICODE_COLOR_INDEX.get(tricode)
+            return min(idx + 1, 30) if idx is not None else 7
+        return _TRICODE_BASIC_PAIR.get(tricode, 7)
 
     def get_team_highlight_pair(self, tricode):
         if not tricode or self._pair_mode in ("high_contrast", "light"):
             return 31
         tricode = tricode.upper()
         if tricode in ("BKN", "SAS", "LAL"):
-            return 39 if self._pair_mode == "basic" else (list(constants.TEAM_COLORS_RGB.keys()).index(tricode) + 31)
+            return 39 if self._pair_mode == "basic" else (_TRICODE_COLOR_INDEX[tricode] + 31)
         if self._pair_mode == "truecolor":
-            tricodes = list(constants.TEAM_COLORS_RGB.keys())
-            if tricode in tricodes:
-                return min(tricodes.index(tricode) + 31, 60)
-            return 31
-        color = TRICODE_TO_BASIC_COLOR.get(tricode, curses.COLOR_WHITE)
-        return {curses.COLOR_RED: 31, curses.COLOR_GREEN: 32, curses.COLOR_YELLOW: 33,
-                curses.COLOR_BLUE: 34, curses.COLOR_MAGENTA: 35, curses.COLOR_CYAN: 36,
-                curses.COLOR_WHITE: 37}.get(color, 37)
+            idx = _TRICODE_COLOR_INDEX.get(tricode)
+            return min(idx + 31, 60) if idx is not None else 31
+        return _TRICODE_BASIC_PAIR.get(tricode, 7) + 30
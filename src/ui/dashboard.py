@@ -1,15 +1,16 @@
 """Dashboard: game list (in progress, not started, final), standings, and league leaders."""
 import curses
 from datetime import datetime, timezone
-from dateutil import parser
+from functools import lru_cache
 
 import config
 import constants
-from core import categorize_games, format_live_clock, game_index_label
+from core import categorize_games, format_live_clock, game_index_label, parse_utc
 from .helpers import format_team_name
 
 _format_live_clock = format_live_clock
 _game_index_label = game_index_label
+_FAR_FUTURE = datetime.max.replace(tzinfo=timezone.utc)
 
 
 def _standings_row_attr(rank):
@@ -35,9 +36,9 @@ def draw_game_row(stdscr, row, game, i, width, cfg, color_ctx, tz_info=None, lay
     try:
         game_time_utc = game.get("gameTimeUTC")
         if game_time_utc:
-            game_time = parser.parse(game_time_utc).replace(tzinfo=timezone.utc)
+            game_time = parse_utc(game_time_utc)
             game_time = game_time.astimezone(tz_info) if tz_info else game_time.astimezone(tz=None)
-            time_str = game_time.strftime("%H:%M")
+            time_str = f"{game_time.hour:02d}:{game_time.minute:02d}"
         else:
             time_str = "-"
     except Exception:
@@ -286,14 +287,22 @@ def _draw_standings_narrow(stdscr, table_start, east, west, height, color_ctx, s
             pass
 
 
-def _draw_dashboard_footer(stdscr, height, width, cfg, filter_favorite_only=False, scroll_hint=False):
+@lru_cache(maxsize=16)
+def _footer_lines(language, fav_tricode, filter_favorite_only):
+    """Both footer lines for a language/favorite/filter combination; built once, reused every redraw."""
+    cfg = {"language": language}
     filter_label = config.get_text(cfg, "footer_filter")
     if filter_favorite_only:
         filter_label = filter_label + " *"
-    fav_tricode = config.favorite_team(cfg)
     fav_label = constants.TRICODE_TO_TEAM_NAME.get(fav_tricode, config.get_text(cfg, "footer_favorite"))
     line1 = f" [1-9,0,a-j] {config.get_text(cfg, 'footer_games')}  [T] {config.get_text(cfg, 'footer_teams')}  [L] {fav_label}  [G] {config.get_text(cfg, 'footer_date')}  [,][.]  [D] {config.get_text(cfg, 'footer_today')}  [R] {config.get_text(cfg, 'footer_refresh')} "
     line2 = f" [F] {filter_label}  [C] {config.get_text(cfg, 'footer_config')}  [?] {config.get_text(cfg, 'footer_help')}  [Q] {config.get_text(cfg, 'footer_quit')} "
+    return line1, line2
+
+
+def _draw_dashboard_footer(stdscr, height, width, cfg, filter_favorite_only=False, scroll_hint=False):
+    language = (cfg or {}).get("language", "en")
+    line1, line2 = _footer_lines(language, config.favorite_team(cfg), bool(filter_favorite_only))
     if scroll_hint:
         line2 += " [↑][↓] Scroll standings "
     try:
@@ -319,7 +328,7 @@ def _favorite_notification(all_games, em_andamento, nao_comecaram, fav, cfg, tz_
         if not _game_has_team(g, fav):
             continue
         try:
-            gt = parser.parse(g.get("gameTimeUTC") or "").replace(tzinfo=timezone.utc)
+            gt = parse_utc(g.get("gameTimeUTC") or "")
             if tz_info:
                 gt = gt.astimezone(tz_info)
             else:
@@ -351,7 +360,7 @@ def draw_dashboard(stdscr, games, scoreboard_date, east, west, game_date_str, cf
         nao_comecaram = [g for g in nao_comecaram if _game_has_team(g, fav)]
         finalizados = [g for g in finalizados if _game_has_team(g, fav)]
 
-    all_games = em_andamento + nao_comecaram + finalizados
+    all_games = [*em_andamento, *nao_comecaram, *finalizados]
 
     if refresh_in_progress:
         live_str = " " + config.get_text(cfg or {}, "header_updating") + " "
@@ -415,17 +424,17 @@ def _make_game_sort_key(cfg, game_sort, fav):
     if not game_sort or game_sort == "time":
         def by_time(g):
             try:
-                return parser.parse(g.get("gameTimeUTC", "") or "9999")
+                return parse_utc(g.get("gameTimeUTC", "") or "")
             except Exception:
-                return parser.parse("9999")
+                return _FAR_FUTURE
         return by_time
     if game_sort == "favorite_first" and fav:
         def by_fav_then_time(g):
             has_fav = 0 if _game_has_team(g, fav) else 1
             try:
-                t = parser.parse(g.get("gameTimeUTC", "") or "9999")
+                t = parse_utc(g.get("gameTimeUTC", "") or "")
             except Exception:
-                t = parser.parse("9999")
+                t = _FAR_FUTURE
             return (has_fav, t)
         return by_fav_then_time
     return None
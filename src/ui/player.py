@@ -1,8 +1,6 @@
 """Player page: season stats, recent games, and profile (opened from box score or team roster)."""
 import curses
 import re
-from datetime import timezone
-from dateutil import parser
 
 import config
 from .helpers import safe_addstr, wait_key
@@ -2,11 +2,10 @@
 import curses
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
-from datetime import timezone
-from dateutil import parser
 
 import config
 import constants
+from core import parse_utc
 from .helpers import safe_addstr, wait_key, format_team_name, apply_page_scroll_key, clamp_scroll_offset
 from . import player as player_ui
 from nba_api.stats.library.parameters import StatCategoryAbbreviation
@@ -77,7 +76,7 @@ def _load_team_page_data(api_client, team_id, tricode):
         fut_ast = executor.submit(api_client.fetch_team_page_leader, StatCategoryAbbreviation.ast, tricode, "AST")
         fut_upcoming = executor.submit(api_client.fetch_team_upcoming_games, tricode)
         fut_past = executor.submit(api_client.fetch_team_games, team_id)
-        fut_roster = executor.submit(api_client.fetch_team_roster, team_id)
+        fut_roster = executor.submit(api_client.fetch_team_roster_records, team_id)
         info = fut_info.result()
         leader_data = {}
         for fut in (fut_pts, fut_reb, fut_ast):
@@ -86,8 +85,7 @@ def _load_team_page_data(api_client, team_id, tricode):
                 leader_data[col] = data
         upcoming = fut_upcoming.result()
         past = fut_past.result()
-        roster_df = fut_roster.result()
-    roster_list = roster_df.to_dict("records") if roster_df is not None and not roster_df.empty else []
+        roster_list = fut_roster.result()
     h2h = _fetch_head_to_head_for_next_opponent(api_client, team_id, tricode, upcoming)
     return TeamPageData(info, leader_data, upcoming, past, roster_list, h2h)
 
@@ -223,8 +221,8 @@ def _draw_team_upcoming_section(draw, row, max_row, upcoming):
         home = g.get("homeTeam", {})
         a, h = format_team_name(away), format_team_name(home)
         try:
-            gt = parser.parse(g.get("gameTimeUTC", "") or "").replace(tzinfo=timezone.utc).astimezone(tz=None)
-            time_str = gt.strftime("%H:%M")
+            gt = parse_utc(g.get("gameTimeUTC", "") or "").astimezone(tz=None)
+            time_str = f"{gt.hour:02d}:{gt.minute:02d}"
         except Exception:
             time_str = "--:--"
         draw(row, f"  {date_str} {time_str} - {a} @ {h}")
@@ -1,5 +1,6 @@
 """Integration tests for API client with mocked nba_api endpoints."""
 import sys
+import threading
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -54,8 +55,8 @@ class TestApiClientFetchGames(unittest.TestCase):
 class TestApiClientFetchStandings(unittest.TestCase):
     """Test fetch_standings with mocked LeagueStandingsV3."""
 
-    @patch("api._disk_cache_set")
-    @patch("api._disk_cache_get", return_value=None)
+    @patch("api._disk_cache_set_frames")
+    @patch("api._disk_cache_get_frames", return_value=None)
     @patch("api._with_retry")
     def test_fetch_standings_returns_east_west(self, mock_retry, mock_disk_get, mock_disk_set):
         mock_retry.side_effect = lambda thunk: thunk()
@@ -73,7 +74,7 @@ class TestApiClientFetchStandings(unittest.TestCase):
 
         with patch("api.leaguestandingsv3.LeagueStandingsV3", return_value=mock_standings):
             client = api.ApiClient()
-            client._cache_standings.clear()
+            client._memo_standings = None
             east, west = client.fetch_standings()
         self.assertIsNotNone(east)
         self.assertIsNotNone(west)
@@ -121,6 +122,96 @@ class TestApiClientHeadToHead(unittest.TestCase):
         self.assertEqual(h2h["season_series"]["wins_b"], 1)
 
 
+@unittest.skipIf(api is None, "api not available")
+class TestRateLimit(unittest.TestCase):
+    """Test _rate_limit spaces concurrent callers by the minimum interval."""
+
+    def test_concurrent_callers_get_distinct_slots(self):
+        client = api.ApiClient()
+        delays = []
+        start = threading.Barrier(3)
+
+        def call():
+            start.wait(2)
+            client._rate_limit()
+
+        with patch("api.time.sleep", side_effect=delays.append), patch("api.time.monotonic", return_value=1000.0):
+            threads = [threading.Thread(target=call) for _ in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(2)
+        interval = api.constants.RATE_LIMIT_MIN_INTERVAL
+        self.assertEqual(len(delays), 2)
+        self.assertEqual(sorted(round(d, 6) for d in delays), [round(interval, 6), round(2 * interval, 6)])
+
+
+@unittest.skipIf(api is None, "api not available")
+class TestSingleflight(unittest.TestCase):
+    """Test _singleflight coalesces concurrent calls for the same key."""
+
+    def test_concurrent_callers_share_one_call(self):
+        client = api.ApiClient()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait(2)
+            return "result"
+
+        results = []
+
+        def call():
+            results.append(client._singleflight("k", fn))
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        self.assertTrue(started.wait(2), "leader never started")
+        followers = [threading.Thread(target=call) for _ in range(3)]
+        for t in followers:
+            t.start()
+        for t in followers:
+            t.join(0.2)
+        release.set()
+        for t in [leader] + followers:
+            t.join()
+        self.assertEqual(results, ["result"] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertNotIn("k", client._inflight)
+
+    def test_exception_propagates_and_clears_key(self):
+        client = api.ApiClient()
+
+        def fn():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            client._singleflight("k", fn)
+        self.assertNotIn("k", client._inflight)
+
+
+@unittest.skipIf(api is None, "api not available")
+class TestIsTransient(unittest.TestCase):
+    """Test _is_transient decides which errors _with_retry retries."""
+
+    def _http_error(self, status):
+        response = MagicMock(status_code=status)
+        return api.requests.HTTPError(response=response)
+
+    def test_retries_timeouts_and_throttling(self):
+        self.assertTrue(api._is_transient(api.requests.Timeout()))
+        self.assertTrue(api._is_transient(api.requests.ConnectionError()))
+        self.assertTrue(api._is_transient(self._http_error(429)))
+        self.assertTrue(api._is_transient(self._http_error(503)))
+
+    def test_does_not_retry_permanent_errors(self):
+        self.assertFalse(api._is_transient(self._http_error(404)))
+        self.assertFalse(api._is_transient(KeyError("resultSets")))
+
+
 @unittest.skipIf(api is None, "api not available")
 class TestUserFacingError(unittest.TestCase):
     """Test _user_facing_error maps exceptions to short messages."""
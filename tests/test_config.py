@@ -57,6 +57,33 @@ class TestAppConfig(unittest.TestCase):
             config.AppConfig(refresh_interval_seconds=301)
 
 
+class TestValidateCfg(unittest.TestCase):
+    def test_matches_pydantic_dump(self):
+        data = {"language": "pt", "refresh_interval_seconds": 60, "favorite_team": "BOS", "theme": "light", "extra": 1}
+        self.assertEqual(config._validate_cfg(data), config.AppConfig.model_validate(data).model_dump())
+        for refresh in (30.0, "45", " 45 ", "45.0", True, False):
+            data = {"refresh_interval_seconds": refresh}
+            with self.subTest(refresh=refresh):
+                self.assertEqual(config._validate_cfg(data), config.AppConfig.model_validate(data).model_dump())
+
+    def test_rejects_what_pydantic_rejects(self):
+        for refresh in (30.5, "1e1", "", None):
+            data = {"refresh_interval_seconds": refresh}
+            with self.subTest(refresh=refresh):
+                with self.assertRaises(Exception):
+                    config.AppConfig.model_validate(data)
+                with self.assertRaises(ValueError):
+                    config._validate_cfg(data)
+
+    def test_missing_keys_take_defaults(self):
+        self.assertEqual(config._validate_cfg({}), config.DEFAULT_CONFIG)
+
+    def test_rejects_invalid_fields(self):
+        for bad in ({"language": "fr"}, {"refresh_interval_seconds": 301}, {"favorite_team": "X"}, {"timezone": ""}):
+            with self.assertRaises(ValueError):
+                config._validate_cfg(bad)
+
+
 class TestConfigHelpers(unittest.TestCase):
     def test_get_text_en(self):
         self.assertEqual(config.get_text({"language": "en"}, "footer_quit"), "Quit")
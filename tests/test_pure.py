@@ -5,7 +5,7 @@ from datetime import date
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
-from core import categorize_games, format_live_clock, game_index_label
+from core import categorize_games, format_live_clock, game_index_label, parse_utc
 from ui.screens import parse_date_string
 from ui.helpers import format_team_name
 import constants
@@ -72,6 +72,10 @@ class TestFormatLiveClock(unittest.TestCase):
         g = {"gameStatusText": "", "period": 2, "gameClock": "PT0M45S"}
         self.assertEqual(format_live_clock(g), "Q2 0:45")
 
+    def test_from_period_clock_seconds_only(self):
+        g = {"gameStatusText": "", "period": 4, "gameClock": "PT12.50S"}
+        self.assertEqual(format_live_clock(g), "Q4 0:12")
+
     def test_empty(self):
         self.assertEqual(format_live_clock({}), "-")
         self.assertEqual(format_live_clock({"gameStatusText": ""}), "-")
@@ -87,6 +91,14 @@ class TestGetTricodeFromTeam(unittest.TestCase):
         self.assertEqual(constants.get_tricode_from_team("Unknown Team"), "")
 
 
+class TestTricodeToTeamName(unittest.TestCase):
+    def test_covers_every_team_with_canonical_names(self):
+        self.assertEqual(set(constants.TRICODE_TO_TEAM_NAME), set(constants.TRICODE_TO_TEAM_ID))
+        for tricode, name in constants.TRICODE_TO_TEAM_NAME.items():
+            self.assertEqual(constants.TEAM_TO_TRICODE[name], tricode)
+        self.assertEqual(constants.TRICODE_TO_TEAM_NAME["LAL"], "Los Angeles Lakers")
+
+
 class TestGameIndexLabel(unittest.TestCase):
     def test_labels(self):
         self.assertEqual(game_index_label(0), " [1] ")
@@ -137,6 +149,78 @@ class TestIsTripleDouble(unittest.TestCase):
         self.assertFalse(constants.is_triple_double({}))
 
 
+class TestParseUtc(unittest.TestCase):
+    def test_z_suffix(self):
+        dt = parse_utc("2025-02-16T00:30:00Z")
+        self.assertEqual((dt.year, dt.month, dt.day, dt.hour, dt.minute), (2025, 2, 16, 0, 30))
+        self.assertEqual(dt.utcoffset().total_seconds(), 0)
+
+    def test_memoized(self):
+        self.assertIs(parse_utc("2025-02-16T01:00:00Z"), parse_utc("2025-02-16T01:00:00Z"))
+
+    def test_invalid_raises(self):
+        with self.assertRaises(ValueError):
+            parse_utc("")
+
+
+class TestTripleDoubleMask(unittest.TestCase):
+    def test_mask_values(self):
+        df = api.pd.DataFrame([
+            {"PTS": 25, "REB": 10, "AST": 12, "STL": 1, "BLK": 0},
+            {"PTS": 30, "REB": 5, "AST": 9, "STL": 2, "BLK": 1},
+            {"PTS": None, "REB": 10, "AST": 10, "STL": 10, "BLK": 0},
+            {"PTS": "x", "REB": 11, "AST": 3, "STL": 0, "BLK": 10},
+        ])
+        self.assertEqual(list(api._triple_double_mask(df)), [True, False, True, False])
+
+    def test_missing_columns_count_as_zero(self):
+        df = api.pd.DataFrame([{"PTS": 12, "REB": 10, "AST": 10}])
+        self.assertEqual(list(api._triple_double_mask(df)), [True])
+
+
+class TestCacheTtu(unittest.TestCase):
+    def test_past_final_games_kept_long(self):
+        value = ([{"gameStatus": 3, "gameStatusText": "Final"}], "2020-01-01")
+        self.assertEqual(api._games_ttu("games:2020-01-01", value, 0), constants.CACHE_TTL_FINAL)
+
+    def test_past_date_with_unfinished_game_short(self):
+        value = ([{"gameStatus": 3}, {"gameStatus": 1, "gameStatusText": "PPD"}], "2020-01-01")
+        self.assertEqual(api._games_ttu("games:2020-01-01", value, 0), constants.CACHE_TTL_GAMES)
+
+    def test_live_games_shortest(self):
+        value = ([{"gameStatus": 3}, {"gameStatus": 2, "gameStatusText": "Q3 5:00"}], "2020-01-01")
+        self.assertEqual(api._games_ttu("games:2020-01-01", value, 0), constants.CACHE_TTL_GAMES_LIVE)
+
+    def test_future_date_short(self):
+        self.assertEqual(api._games_ttu("games:2999-01-01", ([], "2999-01-01"), 0), constants.CACHE_TTL_GAMES)
+
+    def test_box_score_by_status(self):
+        self.assertEqual(api._box_ttu("box:1", {"gameStatus": 3}, 10), 10 + constants.CACHE_TTL_FINAL)
+        self.assertEqual(api._box_ttu("box:1", {"gameStatus": 2}, 10), 10 + constants.CACHE_TTL_BOX_SCORE)
+
+
+class TestResultSet(unittest.TestCase):
+    class _Endpoint:
+        def __init__(self, raw):
+            self.raw = raw
+
+        def get_dict(self):
+            return self.raw
+
+    def test_result_sets_list(self):
+        ep = self._Endpoint({"resultSets": [{"headers": ["A", "B"], "rowSet": [[1, 2]]}]})
+        self.assertEqual(api._result_set(ep), (["A", "B"], [[1, 2]]))
+
+    def test_single_result_set(self):
+        ep = self._Endpoint({"resultSet": {"headers": ["TEAM"], "rowSet": [["BOS"], ["LAL"]]}})
+        self.assertEqual(api._result_set(ep), (["TEAM"], [["BOS"], ["LAL"]]))
+
+    def test_records_projects_columns(self):
+        headers, rows = ["GAME_DATE", "FGM", "PTS"], [["JAN 01, 2025", 40, 110]]
+        self.assertEqual(api._records(headers, rows, ("GAME_DATE", "PTS", "WL")), [{"GAME_DATE": "JAN 01, 2025", "PTS": 110}])
+        self.assertEqual(api._records(headers, rows), [{"GAME_DATE": "JAN 01, 2025", "FGM": 40, "PTS": 110}])
+
+
 class TestBuildQuarterScores(unittest.TestCase):
     def test_empty(self):
         self.assertIsNone(api.build_quarter_scores({}, {}))